@@ -15,33 +15,66 @@ Results are stored in a SQLite database for tracking and future reference.
 import argparse
 import os
 import sys
-import glob
 import hashlib
+import importlib.util
+import itertools
 import json
+import logging
 import sqlite3
 import time
 from datetime import datetime
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterable, List, Tuple, Any, Optional
 
 # Add the libs directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "libs"))
 
-# Import modules from libs directory
-import pydeps_tools as pydeps
-from abbreviator import abbreviate_code
+# Modules from the libs directory are imported inside the functions that use
+# them, so commands like `db --list` don't pay for libcst/openai at startup.
+# find_spec only locates the optional modules, it doesn't execute them.
+HAS_QUERY_LLM = (
+    importlib.util.find_spec("query_llm") is not None
+    and importlib.util.find_spec("openai") is not None
+)
+HAS_ENHANCE_DEPS = importlib.util.find_spec("enhance_dependencies") is not None
 
-# Import optional modules if they exist
-try:
-    import query_llm
-    HAS_QUERY_LLM = True
-except ImportError:
-    HAS_QUERY_LLM = False
+log = logging.getLogger(__name__)
 
-try:
-    import enhance_dependencies
-    HAS_ENHANCE_DEPS = True
-except ImportError:
-    HAS_ENHANCE_DEPS = False
+SEPARATOR = "=" * 60
+
+# Loggers of the libs modules that -v/--verbose turns up to DEBUG
+VERBOSE_LOGGERS = ("query_llm", "enhance_dependencies")
+
+# Output locations, relative to the working directory
+DEPS_DIR = os.path.join("data", "output", "dependencies")
+ABBREV_DIR = os.path.join("data", "output", "abbreviations")
+ABBREV_CACHE_DIR = os.path.join("data", "cache", "abbreviations")
+
+
+def configure_logging(level: int = logging.INFO, buffered: bool = False) -> None:
+    """
+    Send status logging to stdout.
+    
+    Args:
+        level: Minimum level to emit (default: INFO)
+        buffered: Whether to batch records in memory, flushing on errors or
+            when the buffer fills, instead of writing every line immediately
+    """
+    handler: logging.Handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    if buffered:
+        # logging.handlers pulls in socket, pickle and queue; only `test` needs it
+        from logging.handlers import MemoryHandler
+        handler = MemoryHandler(capacity=1000, flushLevel=logging.ERROR, target=handler)
+    
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(level)
+
+
+def flush_logging() -> None:
+    """Flush any records held by buffered logging handlers."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
 
 
 def setup_database() -> sqlite3.Connection:
@@ -55,7 +88,16 @@ def setup_database() -> sqlite3.Connection:
     db_path = os.path.join("data", "db", "code_analysis.db")
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
     
-    conn = sqlite3.connect(db_path)
+    # Autocommit mode; writes manage their own BEGIN/COMMIT
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    
+    # WAL with synchronous=NORMAL avoids an fsync per commit
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    
     cursor = conn.cursor()
     
     # Create tables if they don't exist
@@ -65,192 +107,463 @@ def setup_database() -> sqlite3.Connection:
         file_path TEXT,
         file_size INTEGER,
         file_md5 TEXT,
-        modified_date TEXT,
-        analysis_date TEXT,
+        modified_date INTEGER,  -- ms since the epoch
+        analysis_date INTEGER,  -- ms since the epoch
         analysis_type TEXT,
         parameters TEXT,
         output_path TEXT,
         characters_saved INTEGER,
-        percent_saved REAL
+        percent_saved REAL,
+        cache_hit INTEGER DEFAULT 0
     )
     ''')
     
-    conn.commit()
+    # Databases created before cache_hit existed need the column added
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(analysis_results)")}
+    if "cache_hit" not in columns:
+        cursor.execute("ALTER TABLE analysis_results ADD COLUMN cache_hit INTEGER DEFAULT 0")
+    
+    # Databases created before dates were stored as epoch milliseconds hold
+    # ISO strings in TEXT columns
+    column_types = {row[1]: row[2] for row in cursor.execute("PRAGMA table_info(analysis_results)")}
+    if column_types["analysis_date"].upper() != "INTEGER":
+        migrate_dates_to_epoch_ms(conn)
+    
+    # Indexes for the db --list sort and for lookups by file content
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_analysis_date ON analysis_results(analysis_date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_file_key ON analysis_results(file_md5, analysis_type)")
+    
     return conn
 
 
-def calculate_md5(file_path: str) -> str:
+def migrate_dates_to_epoch_ms(conn: sqlite3.Connection) -> None:
     """
-    Calculate MD5 hash of a file.
+    Rebuild analysis_results with INTEGER modified_date/analysis_date columns.
+    
+    The old values are naive local-time ISO strings, as written by
+    datetime.isoformat(), and are converted to milliseconds since the epoch.
+    
+    Args:
+        conn: Database connection
+    """
+    to_ms = "CAST(ROUND((julianday({0}, 'utc') - 2440587.5) * 86400000) AS INTEGER)"
+    
+    conn.execute("BEGIN")
+    try:
+        conn.execute('''
+        CREATE TABLE analysis_results_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            file_path TEXT,
+            file_size INTEGER,
+            file_md5 TEXT,
+            modified_date INTEGER,
+            analysis_date INTEGER,
+            analysis_type TEXT,
+            parameters TEXT,
+            output_path TEXT,
+            characters_saved INTEGER,
+            percent_saved REAL,
+            cache_hit INTEGER DEFAULT 0
+        )
+        ''')
+        conn.execute(f'''
+        INSERT INTO analysis_results_new
+        SELECT id, file_path, file_size, file_md5, {to_ms.format("modified_date")},
+            {to_ms.format("analysis_date")}, analysis_type, parameters, output_path,
+            characters_saved, percent_saved, cache_hit
+        FROM analysis_results
+        ''')
+        conn.execute("DROP TABLE analysis_results")
+        # Keep views such as analysis_summary pointing at the new table
+        conn.execute("PRAGMA legacy_alter_table=ON")
+        conn.execute("ALTER TABLE analysis_results_new RENAME TO analysis_results")
+        conn.execute("PRAGMA legacy_alter_table=OFF")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def calculate_file_hash(file_path: str) -> str:
+    """
+    Calculate a fast content hash of a file.
+    
+    The hash is only used as a change-detection key, so BLAKE2b with a 128-bit
+    digest is used instead of MD5 (same hex width as the old file_md5 values).
     
     Args:
         file_path: Path to the file
         
     Returns:
-        MD5 hash as a hexadecimal string
+        Hash as a hexadecimal string
     """
-    hash_md5 = hashlib.md5()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+        # Python 3.11+ runs the read loop in C
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+        return hasher.hexdigest()
 
 
-def analyze_dependencies(
-    conn: sqlite3.Connection, 
-    script_path: str = "./data/repos/telegram_bot/bot.py", 
-    with_stdlib: bool = False
-) -> str:
+# Cache of (path, mtime_ns, size) -> (file_size, file_hash, modified_date_ms)
+_stat_cache: Dict[Tuple[str, int, int], Tuple[int, str, int]] = {}
+
+
+def file_fingerprint(
+    file_path: str,
+    st: Optional[os.stat_result] = None,
+    file_hash: Optional[str] = None
+) -> Tuple[int, str, int]:
     """
-    Analyze dependencies of a Python script and save to database.
+    Get the size, content hash and modification date of a file.
+    
+    Results are memoized on the file's stat identity, so repeated calls for an
+    unchanged file (e.g. abbreviating it at several depths) skip rehashing.
+    
+    Args:
+        file_path: Path to the file
+        st: Stat result of the file, if the caller already has it open
+        file_hash: Hash of the file contents, if the caller already has them in memory
+        
+    Returns:
+        Tuple of (file_size, file_hash, modification time in ms since the epoch)
+    """
+    if st is None:
+        st = os.stat(file_path)
+    key = (file_path, st.st_mtime_ns, st.st_size)
+    
+    fingerprint = _stat_cache.get(key)
+    if fingerprint is None:
+        fingerprint = (
+            st.st_size,
+            file_hash or calculate_file_hash(file_path),
+            st.st_mtime_ns // 1_000_000
+        )
+        _stat_cache[key] = fingerprint
+    return fingerprint
+
+
+INSERT_RESULT_SQL = '''
+    INSERT INTO analysis_results 
+    (file_path, file_size, file_md5, modified_date, analysis_date, 
+     analysis_type, parameters, output_path, characters_saved, percent_saved, cache_hit)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+LIST_RESULTS_SQL = '''
+    SELECT id, file_path, analysis_type, analysis_date, parameters, characters_saved, percent_saved 
+    FROM analysis_results 
+    ORDER BY analysis_date DESC
+    LIMIT ? OFFSET ?
+'''
+
+
+def build_result_row(
+    file_path: str,
+    analysis_type: str,
+    parameters: Dict[str, Any],
+    output_path: str,
+    chars_saved: int = 0,
+    percent_saved: float = 0.0,
+    cache_hit: bool = False,
+    fingerprint: Optional[Tuple[int, str, int]] = None
+) -> Tuple:
+    """
+    Build an analysis_results row for a file.
+    
+    Args:
+        file_path: Path to the analyzed file
+        analysis_type: Type of analysis that was run
+        parameters: Parameters used for the analysis
+        output_path: Path to the analysis output
+        chars_saved: Number of characters saved (default: 0)
+        percent_saved: Percentage of characters saved (default: 0.0)
+        cache_hit: Whether the output was served from the cache (default: False)
+        fingerprint: Precomputed file_fingerprint result (default: compute it)
+        
+    Returns:
+        Tuple of column values matching INSERT_RESULT_SQL
+    """
+    file_size, file_md5, modified_date = fingerprint or file_fingerprint(file_path)
+    return (
+        file_path,
+        file_size,
+        file_md5,
+        modified_date,
+        time.time_ns() // 1_000_000,
+        analysis_type,
+        json.dumps(parameters),
+        output_path,
+        chars_saved,
+        percent_saved,
+        int(cache_hit)
+    )
+
+
+def bulk_insert_results(conn: sqlite3.Connection, rows: List[Tuple]) -> None:
+    """
+    Insert analysis_results rows in a single transaction.
     
     Args:
         conn: Database connection
+        rows: Rows built by build_result_row
+    """
+    if not rows:
+        return
+    
+    try:
+        conn.execute("BEGIN")
+        conn.executemany(INSERT_RESULT_SQL, rows)
+        conn.execute("COMMIT")
+    except Exception as e:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        log.error("Error saving to database: %s", e)
+
+
+def _run_deps(
+    script_path: str,
+    with_stdlib: bool,
+    timestamp: Optional[int] = None,
+    fingerprint: Optional[Tuple[int, str, int]] = None
+) -> Tuple[str, Optional[Tuple]]:
+    """
+    Run dependency analysis on a script and build its analysis_results row.
+    
+    Args:
         script_path: Path to the script to analyze
         with_stdlib: Whether to include standard library dependencies
+        timestamp: Timestamp used in the output file name (default: now)
+        fingerprint: Precomputed file_fingerprint of the script (default: compute it)
         
     Returns:
-        Path to the output file
+        Tuple of (output file path, row or None if metadata couldn't be read)
     """
-    print(f"\n{'='*60}")
-    print(f"Analyzing dependencies for {script_path}")
-    print(f"{'='*60}")
+    log.info("\n%s\nAnalyzing dependencies for %s\n%s", SEPARATOR, script_path, SEPARATOR)
     
     # Create dependencies directory if it doesn't exist
-    deps_dir = os.path.join("data", "output", "dependencies")
-    os.makedirs(deps_dir, exist_ok=True)
+    os.makedirs(DEPS_DIR, exist_ok=True)
+    
+    if timestamp is None:
+        timestamp = int(time.time())
+    output_file = os.path.join(DEPS_DIR, f"deps_{'all' if with_stdlib else 'min'}_{timestamp}.json")
     
-    output_file = os.path.join(deps_dir, f"deps_{'all' if with_stdlib else 'min'}_{int(time.time())}.json")
+    import pydeps_tools as pydeps
     
     # Run analysis
     pydeps.save_dependencies(script_path, output_file, with_stdlib)
     
-    # Save metadata to database
-    cursor = conn.cursor()
-    
+    # Build the metadata row (no characters saved for dependency analysis)
     try:
-        file_size = os.path.getsize(script_path)
-        file_md5 = calculate_md5(script_path)
-        modified_date = datetime.fromtimestamp(os.path.getmtime(script_path)).isoformat()
-        
-        cursor.execute(
-            '''
-            INSERT INTO analysis_results 
-            (file_path, file_size, file_md5, modified_date, analysis_date, 
-             analysis_type, parameters, output_path, characters_saved, percent_saved)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''',
-            (
-                script_path, 
-                file_size, 
-                file_md5, 
-                modified_date,
-                datetime.now().isoformat(),
-                "dependency_analysis",
-                json.dumps({"with_stdlib": with_stdlib}),
-                output_file,
-                0,  # No characters saved for dependency analysis
-                0.0  # No percentage saved for dependency analysis
-            )
+        row = build_result_row(
+            script_path,
+            "dependency_analysis",
+            {"with_stdlib": with_stdlib},
+            output_file,
+            fingerprint=fingerprint
         )
-        conn.commit()
     except Exception as e:
-        print(f"Error saving to database: {e}")
+        log.error("Error saving to database: %s", e)
+        row = None
     
+    return output_file, row
+
+
+def analyze_dependencies(
+    conn: sqlite3.Connection, 
+    script_path: str = "./data/repos/telegram_bot/bot.py", 
+    with_stdlib: bool = False,
+    timestamp: Optional[int] = None
+) -> str:
+    """
+    Analyze dependencies of a Python script and save to database.
+    
+    Args:
+        conn: Database connection
+        script_path: Path to the script to analyze
+        with_stdlib: Whether to include standard library dependencies
+        timestamp: Timestamp used in the output file name (default: now)
+        
+    Returns:
+        Path to the output file
+    """
+    output_file, row = _run_deps(script_path, with_stdlib, timestamp)
+    if row:
+        bulk_insert_results(conn, [row])
     return output_file
 
 
-def abbreviate_code_file(
-    conn: sqlite3.Connection,
+def abbreviation_cache_path(
+    code_hash: str, depth: int, preserve_chars: int, preserve_lines: int, fast: bool = False
+) -> str:
+    """
+    Get the content-addressed cache path for an abbreviation.
+    
+    The path includes abbreviator_version(), so entries written by an older
+    abbreviator are never read back.
+    
+    Args:
+        code_hash: BLAKE2b hash of the original source file
+        depth: Maximum nesting depth to preserve
+        preserve_chars: Number of characters to preserve per line
+        preserve_lines: Number of lines to preserve
+        fast: Whether the entry comes from the fast abbreviation path
+    
+    Returns:
+        Path of the cache file under data/cache/abbreviations
+    """
+    from file_tools import abbreviator_version
+    
+    suffix = "_fast" if fast else ""
+    return os.path.join(
+        ABBREV_CACHE_DIR,
+        f"{code_hash}_{abbreviator_version()}_{depth}_{preserve_chars}_{preserve_lines}{suffix}"
+    )
+
+
+def abbreviate_code_to_row(
     input_file: str, 
     depth: int,
     preserve_chars: int = 30,
     preserve_lines: int = 2, 
-    debug: bool = False
-) -> str:
+    debug: bool = False,
+    timestamp: Optional[int] = None,
+    fast: bool = False
+) -> Tuple[str, Tuple]:
     """
-    Abbreviate code in a file and save metadata to database.
+    Abbreviate code in a file and build its analysis_results row.
+    
+    ABBREV_DIR and ABBREV_CACHE_DIR must already exist; callers create them
+    once rather than on every file.
     
     Args:
-        conn: Database connection
         input_file: Path to the input file
         depth: Maximum nesting depth to preserve
-        preserve_chars: Number of characters to preserve per line (default: 10)
+        preserve_chars: Number of characters to preserve per line (default: 30)
         preserve_lines: Number of lines to preserve (default: 2)
         debug: Whether to enable debug output
+        timestamp: Timestamp used in the output file name (default: now)
+        fast: Whether to use the stdlib ast abbreviation path instead of LibCST
         
     Returns:
-        Path to the output file
+        Tuple of (output file path, row for bulk_insert_results)
     """
-    print(f"\n{'='*60}")
-    print(f"Abbreviating code in {input_file} (max depth: {depth}, preserve_chars: {preserve_chars}, preserve_lines: {preserve_lines})")
-    print(f"{'='*60}")
-    
-    # Read the input file
-    with open(input_file, "r", encoding="utf-8") as f:
-        code = f.read()
+    log.info(
+        "\n%s\nAbbreviating code in %s (max depth: %d, preserve_chars: %d, preserve_lines: %d)\n%s",
+        SEPARATOR, input_file, depth, preserve_chars, preserve_lines, SEPARATOR
+    )
     
-    # Abbreviate the code
-    abbreviated_code = abbreviate_code(code, depth, preserve_chars, preserve_lines, debug)
+    # Read the input file as bytes; the same buffer feeds the content hash,
+    # the file fingerprint and (decoded once) the abbreviator
+    with open(input_file, "rb") as f:
+        source = f.read()
+        st = os.fstat(f.fileno())
+    code_hash = hashlib.blake2b(source, digest_size=16).hexdigest()
+    fingerprint = file_fingerprint(input_file, st, code_hash)
+    code = source.decode("utf-8")
+    del source
+    
+    # Reuse a cached abbreviation if this content was already processed with these parameters
+    cache_file = abbreviation_cache_path(code_hash, depth, preserve_chars, preserve_lines, fast)
+    cache_hit = os.path.exists(cache_file)
+    
+    if cache_hit:
+        with open(cache_file, "rb") as f:
+            abbreviated = f.read()
+        abbreviated_chars = len(abbreviated.decode("utf-8"))
+        log.info("Using cached abbreviation %s", cache_file)
+        if debug:
+            log.info("Debug summary skipped; the abbreviation was not recomputed")
+    else:
+        if fast:
+            from abbreviator import abbreviate_code_fast
+            if debug:
+                log.info("Debug summary is not available with the fast abbreviation path")
+            abbreviated_code = abbreviate_code_fast(code, depth, preserve_chars, preserve_lines)
+        else:
+            from abbreviator import abbreviate_code
+            abbreviated_code = abbreviate_code(code, depth, preserve_chars, preserve_lines, debug)
+        abbreviated_chars = len(abbreviated_code)
+        
+        # Encode once; the bytes go to both the cache entry and the output file
+        abbreviated = abbreviated_code.encode("utf-8")
+        del abbreviated_code
+        
+        # Write to a temporary file first so a partial write never becomes a cache entry
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(abbreviated)
+        os.replace(tmp_file, cache_file)
     
     # Generate the output file name in data/output/abbreviations directory
     base_name = os.path.basename(input_file)
     name, ext = os.path.splitext(base_name)
-    timestamp = int(time.time())
+    if timestamp is None:
+        timestamp = int(time.time())
     
-    # Create abbreviations directory if it doesn't exist
-    abbrev_dir = os.path.join("data", "output", "abbreviations")
-    os.makedirs(abbrev_dir, exist_ok=True)
-    
-    output_file = os.path.join(abbrev_dir, f"{name}_depth{depth}_{timestamp}{ext}")
+    output_file = os.path.join(ABBREV_DIR, f"{name}_depth{depth}_{timestamp}{ext}")
     
     # Write the abbreviated code to the output file
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(abbreviated_code)
+    with open(output_file, "wb") as f:
+        f.write(abbreviated)
     
     # Calculate statistics
     original_chars = len(code)
-    abbreviated_chars = len(abbreviated_code)
     chars_saved = original_chars - abbreviated_chars
     percent_saved = (chars_saved / original_chars) * 100 if original_chars > 0 else 0
     
-    print(f"Abbreviated code written to {output_file}")
-    print(f"Original file: {original_chars} characters")
-    print(f"Abbreviated file: {abbreviated_chars} characters")
-    print(f"Characters saved: {chars_saved} ({percent_saved:.2f}%)")
-    
-    # Save metadata to database
-    cursor = conn.cursor()
+    log.info("Abbreviated code written to %s", output_file)
+    log.info("Original file: %d characters", original_chars)
+    log.info("Abbreviated file: %d characters", abbreviated_chars)
+    log.info("Characters saved: %d (%.2f%%)", chars_saved, percent_saved)
+    
+    row = build_result_row(
+        input_file,
+        "code_abbreviation",
+        {"depth": depth, "preserve_chars": preserve_chars, "preserve_lines": preserve_lines, "debug": debug, "fast": fast},
+        output_file,
+        chars_saved,
+        percent_saved,
+        cache_hit,
+        fingerprint
+    )
+    return output_file, row
+
+
+def abbreviate_code_file(
+    conn: sqlite3.Connection,
+    input_file: str, 
+    depth: int,
+    preserve_chars: int = 30,
+    preserve_lines: int = 2, 
+    debug: bool = False,
+    fast: bool = False
+) -> str:
+    """
+    Abbreviate code in a file and save metadata to database.
     
-    try:
-        file_size = os.path.getsize(input_file)
-        file_md5 = calculate_md5(input_file)
-        modified_date = datetime.fromtimestamp(os.path.getmtime(input_file)).isoformat()
+    Args:
+        conn: Database connection
+        input_file: Path to the input file
+        depth: Maximum nesting depth to preserve
+        preserve_chars: Number of characters to preserve per line (default: 30)
+        preserve_lines: Number of lines to preserve (default: 2)
+        debug: Whether to enable debug output
+        fast: Whether to use the stdlib ast abbreviation path instead of LibCST
         
-        cursor.execute(
-            '''
-            INSERT INTO analysis_results 
-            (file_path, file_size, file_md5, modified_date, analysis_date, 
-             analysis_type, parameters, output_path, characters_saved, percent_saved)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''',
-            (
-                input_file, 
-                file_size, 
-                file_md5, 
-                modified_date,
-                datetime.now().isoformat(),
-                "code_abbreviation",
-                json.dumps({"depth": depth, "preserve_chars": preserve_chars, "preserve_lines": preserve_lines, "debug": debug}),
-                output_file,
-                chars_saved,
-                percent_saved
-            )
-        )
-        conn.commit()
-    except Exception as e:
-        print(f"Error saving to database: {e}")
+    Returns:
+        Path to the output file
+    """
+    # Create output and cache directories if they don't exist
+    os.makedirs(ABBREV_DIR, exist_ok=True)
+    os.makedirs(ABBREV_CACHE_DIR, exist_ok=True)
     
+    output_file, row = abbreviate_code_to_row(input_file, depth, preserve_chars, preserve_lines, debug, fast=fast)
+    bulk_insert_results(conn, [row])
     return output_file
 
 
@@ -258,7 +571,11 @@ def summarize_abbreviated_code(
     repo_path: str,
     output_dir: str = "data/output/summaries", 
     depth: int = 2,
-    min_char_count: int = 10
+    min_char_count: int = 10,
+    force_refresh: bool = False,
+    model_name: Optional[str] = None,
+    api_base: Optional[str] = None,
+    max_concurrency: Optional[int] = None
 ) -> Dict[str, str]:
     """
     Summarize all the abbreviated Python files using the query_llm module.
@@ -268,6 +585,12 @@ def summarize_abbreviated_code(
         output_dir: Directory to save the summaries
         depth: Maximum nesting depth used in abbreviation
         min_char_count: Minimum character count for a file to be summarized
+        force_refresh: Whether to ask the LLM again even for cached summaries
+        model_name: Model to use (default: query_llm's default)
+        api_base: Base URL of an OpenAI-compatible API, e.g. a local
+            `vllm serve` endpoint (default: query_llm's default)
+        max_concurrency: Maximum LLM requests in flight (default: query_llm's
+            default); batching servers like vLLM benefit from 64 or more
         
     Returns:
         Dictionary mapping file paths to their summaries
@@ -281,10 +604,16 @@ def summarize_abbreviated_code(
     print(f"{'='*60}")
     
     try:
+        import query_llm
+        
+        # Only pass the endpoint settings that were given, keeping query_llm's defaults
+        endpoint = {"model_name": model_name, "api_base": api_base, "max_concurrency": max_concurrency}
         summaries = query_llm.summarize_all_telegram_bot_scripts(
             repo_path=repo_path,
             depth=depth,
-            min_char_count=min_char_count
+            min_char_count=min_char_count,
+            force_refresh=force_refresh,
+            **{name: value for name, value in endpoint.items() if value is not None}
         )
         print(f"Successfully summarized {len(summaries)} scripts")
         return summaries
@@ -328,6 +657,7 @@ def enhance_dependencies_with_summaries(
     
     try:
         # Call the enhance_dependencies function
+        import enhance_dependencies
         enhance_dependencies.enhance_dependencies(deps_file, summaries_dir, output_file)
         print(f"Enhanced dependencies saved to {output_file}")
         return output_file
@@ -342,7 +672,9 @@ def run_all_tests(
     conn: sqlite3.Connection, 
     ensure_repo: bool = True, 
     with_summarization: bool = True,
-    with_enhancement: bool = True
+    with_enhancement: bool = True,
+    max_workers: Optional[int] = None,
+    fast: bool = False
 ) -> None:
     """
     Run all tests on all Python files in the telegram_bot folder.
@@ -352,39 +684,81 @@ def run_all_tests(
         ensure_repo: Whether to ensure the telegram_bot repo exists
         with_summarization: Whether to run summarization after abbreviation
         with_enhancement: Whether to enhance dependencies with summaries
+        max_workers: Number of abbreviation worker processes (default: CPU count)
+        fast: Whether to use the stdlib ast abbreviation path instead of LibCST
     """
     # Updated path for the telegram_bot repository
     repo_path = os.path.join("data", "repos", "telegram_bot")
     
     # Make sure the telegram bot repository exists if requested
     if ensure_repo:
+        import pydeps_tools as pydeps
         pydeps.ensure_telegram_bot(repo_path)
     
-    # 1. Analyze dependencies with updated paths
-    deps_min_file = analyze_dependencies(conn, os.path.join(repo_path, "bot.py"), False)  # Without stdlib
-    analyze_dependencies(conn, os.path.join(repo_path, "bot.py"), True)   # With stdlib
+    # All outputs from this run share one timestamp as a batch id
+    run_timestamp = int(time.time())
+    
+    # 1. Analyze dependencies without and with stdlib. Both runs share one
+    # fingerprint of bot.py and are inserted together.
+    script_path = os.path.join(repo_path, "bot.py")
+    try:
+        fingerprint = file_fingerprint(script_path)
+    except OSError as e:
+        log.error("Error reading %s: %s", script_path, e)
+        fingerprint = None
+    
+    deps_files = {}
+    deps_rows = []
+    for with_stdlib in (False, True):
+        deps_files[with_stdlib], row = _run_deps(script_path, with_stdlib, run_timestamp, fingerprint)
+        if row:
+            deps_rows.append(row)
+    bulk_insert_results(conn, deps_rows)
+    deps_min_file = deps_files[False]
     
     # Find all Python files in the telegram_bot folder
-    py_files = glob.glob(os.path.join(repo_path, "**/*.py"), recursive=True)
+    from file_tools import iter_files
+    py_files = list(iter_files(repo_path, ".py"))
     if not py_files:
-        print(f"No Python files found in the {repo_path} folder.")
+        log.warning("No Python files found in the %s folder.", repo_path)
         return
     
-    print(f"\nFound {len(py_files)} Python files to process.")
-    
-    # 2. Abbreviate each Python file with depth=1
-    for py_file in py_files:
-        try:
-            abbreviate_code_file(conn, py_file, 1, 90, 2, True)
-        except Exception as e:
-            print(f"Error abbreviating {py_file} with depth 1: {e}")
-    
-    # 3. Abbreviate each Python file with depth=2
-    for py_file in py_files:
-        try:
-            abbreviate_code_file(conn, py_file, 2, 90, 2, True)
-        except Exception as e:
-            print(f"Error abbreviating {py_file} with depth 2: {e}")
+    log.info("\nFound %d Python files to process.", len(py_files))
+    
+    # Create output and cache directories once for all workers
+    os.makedirs(ABBREV_DIR, exist_ok=True)
+    os.makedirs(ABBREV_CACHE_DIR, exist_ok=True)
+    
+    # Rows from both abbreviation passes are inserted in one transaction
+    rows = []
+    
+    # 2-3. Abbreviate each Python file with depth=1 and depth=2. Files are
+    # independent, so they are processed in parallel worker processes, which
+    # log unbuffered; flush first so earlier status lines stay in order.
+    flush_logging()
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=configure_logging,
+        initargs=(log.getEffectiveLevel(),)
+    ) as executor:
+        futures = {
+            executor.submit(abbreviate_code_to_row, py_file, depth, 90, 2, True, run_timestamp, fast): (py_file, depth)
+            for depth in (1, 2)
+            for py_file in py_files
+        }
+        for future in as_completed(futures):
+            py_file, depth = futures[future]
+            try:
+                rows.append(future.result()[1])
+            except Exception as e:
+                log.error("Error abbreviating %s with depth %d: %s", py_file, depth, e)
+    
+    bulk_insert_results(conn, rows)
+    log.info("\nAbbreviation cache hits: %d/%d", sum(row[-1] for row in rows), len(rows))
+    
+    # Emit buffered status lines before the summarization output
+    flush_logging()
     
     # 4. Run summarization if requested and available
     summaries = {}
@@ -396,14 +770,20 @@ def run_all_tests(
         enhance_dependencies_with_summaries(deps_min_file)
 
 
-def main():
-    """Main entry point for the script."""
-    # Set up the database
-    conn = setup_database()
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser.
     
+    Returns:
+        Parser for all subcommands, also used for each line of `batch` input
+    """
     parser = argparse.ArgumentParser(
         description="Combined tool for Python dependency analysis and code abbreviation"
     )
+    parser.add_argument("--quiet", action="store_true",
+                        help="Only show warnings and errors")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Also show per-file progress from summarization and enhancement")
     
     # Create subparsers for different modes
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -424,6 +804,8 @@ def main():
     abbr_parser.add_argument("--preserve-lines", type=int, default=2,
                            help="Number of lines to preserve (default: 2)")
     abbr_parser.add_argument("--debug", action="store_true", help="Enable debug output")
+    abbr_parser.add_argument("--fast", action="store_true",
+                           help="Use the stdlib ast abbreviation path (faster, output can differ slightly)")
     
     # Summarize parser
     if HAS_QUERY_LLM:
@@ -434,6 +816,14 @@ def main():
                                help="Depth used for abbreviation (default: 2)")
         summ_parser.add_argument("--min-chars", type=int, default=10,
                                help="Minimum character count for summarization (default: 10)")
+        summ_parser.add_argument("--force-refresh", action="store_true",
+                               help="Summarize again even when a cached summary exists")
+        summ_parser.add_argument("--model",
+                               help="Model to use for summarization")
+        summ_parser.add_argument("--api-base",
+                               help="Base URL of an OpenAI-compatible API, e.g. http://localhost:8000/v1/ for vLLM")
+        summ_parser.add_argument("--concurrency", type=int,
+                               help="Maximum LLM requests in flight (default: 16)")
     
     # Enhance dependencies parser
     if HAS_ENHANCE_DEPS:
@@ -452,13 +842,147 @@ def main():
                           help="Skip summarization step")
     test_parser.add_argument("--no-enhancement", action="store_true",
                           help="Skip dependency enhancement step")
+    test_parser.add_argument("--workers", type=int, default=None,
+                          help="Number of abbreviation worker processes (default: CPU count)")
+    test_parser.add_argument("--fast", action="store_true",
+                          help="Use the stdlib ast abbreviation path (faster, output can differ slightly)")
     
     # Database parser
     db_parser = subparsers.add_parser("db", help="Database operations")
-    db_parser.add_argument("--list", action="store_true", help="List all analysis results")
+    db_parser.add_argument("--list", action="store_true", help="List analysis results, newest first")
+    db_parser.add_argument("--limit", type=int, default=100,
+                         help="Maximum number of results to list, 0 for all (default: 100)")
+    db_parser.add_argument("--offset", type=int, default=0,
+                         help="Number of newest results to skip (default: 0)")
+    
+    # Batch parser (runs commands read from stdin in this process)
+    subparsers.add_parser("batch", help="Run one command per line of stdin, sharing one process and database connection")
+    
+    return parser
+
+
+def run_command(conn: sqlite3.Connection, args: argparse.Namespace) -> None:
+    """
+    Run a single parsed subcommand.
+    
+    Args:
+        conn: SQLite database connection
+        args: Parsed arguments from build_parser
+    """
+    if args.command == "deps":
+        analyze_dependencies(conn, args.script_path, args.with_stdlib)
+    elif args.command == "abbreviate":
+        preserve_chars = getattr(args, 'preserve_chars', 90)
+        preserve_lines = getattr(args, 'preserve_lines', 2)
+        abbreviate_code_file(conn, args.input_file, args.depth, preserve_chars, preserve_lines, args.debug, args.fast)
+    elif args.command == "summarize" and HAS_QUERY_LLM:
+        summarize_abbreviated_code(args.repo_path, depth=args.depth, min_char_count=args.min_chars,
+                                   force_refresh=args.force_refresh, model_name=args.model,
+                                   api_base=args.api_base, max_concurrency=args.concurrency)
+    elif args.command == "enhance" and HAS_ENHANCE_DEPS:
+        enhance_dependencies_with_summaries(args.deps_file, args.summaries_dir, args.output_dir)
+    elif args.command == "test":
+        run_all_tests(conn, not args.no_ensure_repo, not args.no_summarization, not args.no_enhancement, args.workers,
+                      args.fast)
+    elif args.command == "db" and args.list:
+        # Rows are streamed from the cursor rather than fetched all at once
+        cursor = conn.execute(LIST_RESULTS_SQL, (args.limit if args.limit > 0 else -1, args.offset))
+        first = cursor.fetchone()
+        
+        if first is None:
+            print("No analysis results found in the database.")
+        else:
+            print("\nAnalysis Results:")
+            print(f"{'ID':<5} {'File':<30} {'Type':<20} {'Date':<25} {'Params':<20} {'Chars Saved':<15} {'Percent':<10}")
+            print("-" * 110)
+            
+            for row in itertools.chain((first,), cursor):
+                id, file_path, analysis_type, analysis_date, parameters, chars_saved, percent_saved = row
+                file_name = os.path.basename(file_path)
+                date_str = datetime.fromtimestamp(analysis_date / 1000).isoformat(timespec="seconds")
+                params = json.loads(parameters)
+                params_str = ", ".join(f"{k}={v}" for k, v in params.items())
+                
+                print(f"{id:<5} {file_name:<30} {analysis_type:<20} {date_str:<25} {params_str:<20} {chars_saved:<15} {percent_saved:<10.2f}%")
+
+
+# Number of deps/abbreviate results a batch run commits per transaction
+BATCH_COMMIT_SIZE = 100
+
+
+def run_batch(conn: sqlite3.Connection, parser: argparse.ArgumentParser, lines: Iterable[str]) -> None:
+    """
+    Run one command per line, e.g. `abbreviate src/app.py --depth 1`.
+    
+    Every command shares this process and connection, so the interpreter
+    start-up and imports are paid once. Results of deps and abbreviate
+    commands are committed BATCH_COMMIT_SIZE rows at a time; pending rows
+    are committed before any other command runs so it sees them. Blank
+    lines and lines starting with "#" are skipped, and a line that fails
+    is logged without stopping the batch.
+    
+    Args:
+        conn: SQLite database connection
+        parser: Parser from build_parser
+        lines: Command lines, usually sys.stdin
+    """
+    import shlex
     
+    os.makedirs(ABBREV_DIR, exist_ok=True)
+    os.makedirs(ABBREV_CACHE_DIR, exist_ok=True)
+    
+    pending: List[Tuple] = []
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        
+        try:
+            args = parser.parse_args(shlex.split(line))
+            if args.command == "deps":
+                _, row = _run_deps(args.script_path, args.with_stdlib)
+                if row is not None:
+                    pending.append(row)
+            elif args.command == "abbreviate":
+                _, row = abbreviate_code_to_row(
+                    args.input_file, args.depth, args.preserve_chars, args.preserve_lines, args.debug, fast=args.fast
+                )
+                pending.append(row)
+            elif args.command == "batch":
+                log.error("Line %d: batch cannot be nested", line_no)
+            else:
+                bulk_insert_results(conn, pending)
+                pending = []
+                run_command(conn, args)
+        except SystemExit:
+            # argparse has already reported the usage error
+            log.error("Line %d: invalid command: %s", line_no, line)
+        except Exception as e:
+            log.error("Line %d: %s failed: %s", line_no, line, e)
+        
+        if len(pending) >= BATCH_COMMIT_SIZE:
+            bulk_insert_results(conn, pending)
+            pending = []
+    
+    bulk_insert_results(conn, pending)
+
+
+def main():
+    """Main entry point for the script."""
+    # Set up the database
+    conn = setup_database()
+    
+    parser = build_parser()
     args = parser.parse_args()
     
+    # Batch status output for the test command, which logs per file
+    configure_logging(logging.WARNING if args.quiet else logging.INFO, buffered=args.command == "test")
+    if args.verbose:
+        # Per-file progress from the libs is logged at DEBUG; leave other
+        # libraries (openai, httpx) at the root level
+        for name in VERBOSE_LOGGERS:
+            logging.getLogger(name).setLevel(logging.DEBUG)
+    
     # If no command is specified, show help
     if not args.command:
         parser.print_help()
@@ -467,42 +991,12 @@ def main():
     
     # Handle commands
     try:
-        if args.command == "deps":
-            analyze_dependencies(conn, args.script_path, args.with_stdlib)
-        elif args.command == "abbreviate":
-            preserve_chars = getattr(args, 'preserve_chars', 90)
-            preserve_lines = getattr(args, 'preserve_lines', 2)
-            abbreviate_code_file(conn, args.input_file, args.depth, preserve_chars, preserve_lines, args.debug)
-        elif args.command == "summarize" and HAS_QUERY_LLM:
-            summarize_abbreviated_code(args.repo_path, depth=args.depth, min_char_count=args.min_chars)
-        elif args.command == "enhance" and HAS_ENHANCE_DEPS:
-            enhance_dependencies_with_summaries(args.deps_file, args.summaries_dir, args.output_dir)
-        elif args.command == "test":
-            run_all_tests(conn, not args.no_ensure_repo, not args.no_summarization, not args.no_enhancement)
-        elif args.command == "db" and args.list:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, file_path, analysis_type, analysis_date, parameters, characters_saved, percent_saved 
-                FROM analysis_results 
-                ORDER BY analysis_date DESC
-            ''')
-            results = cursor.fetchall()
-            
-            if not results:
-                print("No analysis results found in the database.")
-            else:
-                print("\nAnalysis Results:")
-                print(f"{'ID':<5} {'File':<30} {'Type':<20} {'Date':<25} {'Params':<20} {'Chars Saved':<15} {'Percent':<10}")
-                print("-" * 110)
-                
-                for row in results:
-                    id, file_path, analysis_type, analysis_date, parameters, chars_saved, percent_saved = row
-                    file_name = os.path.basename(file_path)
-                    params = json.loads(parameters)
-                    params_str = ", ".join(f"{k}={v}" for k, v in params.items())
-                    
-                    print(f"{id:<5} {file_name:<30} {analysis_type:<20} {analysis_date:<25} {params_str:<20} {chars_saved:<15} {percent_saved:<10.2f}%")
+        if args.command == "batch":
+            run_batch(conn, parser, sys.stdin)
+        else:
+            run_command(conn, args)
     finally:
+        flush_logging()
         # Close the database connection
         conn.close()
 
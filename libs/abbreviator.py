@@ -6,12 +6,50 @@ beyond a specified depth, replacing them with a preview, ellipsis comments and p
 Sections are only abbreviated if doing so actually reduces the character count.
 """
 
+import array
+import ast
+import functools
+import io
+import itertools
 import os
 import sys
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple, Union
 
 import libcst as cst
-from libcst.metadata import ParentNodeProvider, PositionProvider
+
+# Shared by every serialization; Module.code_for_node only reads its
+# default indent and newline
+_EMPTY_MODULE = cst.Module([])
+
+# Comment text shared by every abbreviated block
+_ELLIPSIS_COMMENT_VALUE = sys.intern("# ...")
+_PREVIEW_PREFIX = sys.intern("# ")
+
+# Shortest possible abbreviated block: the header newline plus the
+# "    # ..." and "    pass" lines, before any preview comments
+_MIN_ABBREVIATED_LEN = 1 + 10 + 9
+
+# Names of the node types DebugInfo has recorded, indexed by _node_type_index
+_NODE_TYPE_NAMES: List[str] = []
+_NODE_TYPE_INDEXES: Dict[type, int] = {}
+
+
+def _node_type_index(node: cst.CSTNode) -> int:
+    """
+    Get the index of a node's type name in _NODE_TYPE_NAMES.
+    
+    Args:
+        node: The node to look up
+    
+    Returns:
+        int: Index of the node's type name, registered on first use
+    """
+    node_type = type(node)
+    index = _NODE_TYPE_INDEXES.get(node_type)
+    if index is None:
+        index = _NODE_TYPE_INDEXES[node_type] = len(_NODE_TYPE_NAMES)
+        _NODE_TYPE_NAMES.append(node_type.__name__)
+    return index
 
 
 class DebugInfo:
@@ -28,10 +66,15 @@ class DebugInfo:
         self.nodes_considered = 0
         self.nodes_abbreviated = 0
         self.nodes_skipped = 0  # Nodes that weren't abbreviated due to no size reduction
-        self.abbreviated_nodes = []
-        self.skipped_nodes = []  # Nodes that weren't abbreviated
+        # Abbreviated and skipped nodes, stored column by column
+        self._abbreviated_types: List[int] = []
+        self._abbreviated_depths = array.array("l")
+        self._abbreviated_chars = array.array("l")
+        self._skipped_types: List[int] = []
+        self._skipped_depths = array.array("l")
+        self._skipped_reasons: List[str] = []
         self.max_depth_reached = 0
-        self.depth_counts = {}
+        self.depth_counts = [0] * 32  # Node count per depth, grown as needed
         self.chars_saved = 0  # Track total characters saved
     
     def consider_node(self, node: cst.CSTNode, depth: int) -> None:
@@ -42,15 +85,12 @@ class DebugInfo:
             node: The node being considered
             depth: Current nesting depth
         """
-        if not self.enabled:
-            return
-            
         self.nodes_considered += 1
         self.max_depth_reached = max(self.max_depth_reached, depth)
         
         # Count nodes at each depth
-        if depth not in self.depth_counts:
-            self.depth_counts[depth] = 0
+        if depth >= len(self.depth_counts):
+            self.depth_counts.extend([0] * (depth - len(self.depth_counts) + 1))
         self.depth_counts[depth] += 1
     
     def abbreviate_node(self, node: cst.CSTNode, depth: int, chars_saved: int) -> None:
@@ -62,11 +102,10 @@ class DebugInfo:
             depth: Current nesting depth
             chars_saved: Number of characters saved by abbreviation
         """
-        if not self.enabled:
-            return
-            
         self.nodes_abbreviated += 1
-        self.abbreviated_nodes.append((node.__class__.__name__, depth, chars_saved))
+        self._abbreviated_types.append(_node_type_index(node))
+        self._abbreviated_depths.append(depth)
+        self._abbreviated_chars.append(chars_saved)
         self.chars_saved += chars_saved
     
     def skip_node(self, node: cst.CSTNode, depth: int, reason: str) -> None:
@@ -78,11 +117,28 @@ class DebugInfo:
             depth: Current nesting depth
             reason: Reason for not abbreviating
         """
-        if not self.enabled:
-            return
-            
         self.nodes_skipped += 1
-        self.skipped_nodes.append((node.__class__.__name__, depth, reason))
+        self._skipped_types.append(_node_type_index(node))
+        self._skipped_depths.append(depth)
+        self._skipped_reasons.append(reason)
+    
+    @property
+    def abbreviated_nodes(self) -> List[Tuple[str, int, int]]:
+        """Abbreviated nodes as (node type, depth, chars saved) tuples."""
+        return [
+            (_NODE_TYPE_NAMES[node_type], depth, chars_saved)
+            for node_type, depth, chars_saved
+            in zip(self._abbreviated_types, self._abbreviated_depths, self._abbreviated_chars)
+        ]
+    
+    @property
+    def skipped_nodes(self) -> List[Tuple[str, int, str]]:
+        """Nodes that weren't abbreviated as (node type, depth, reason) tuples."""
+        return [
+            (_NODE_TYPE_NAMES[node_type], depth, reason)
+            for node_type, depth, reason
+            in zip(self._skipped_types, self._skipped_depths, self._skipped_reasons)
+        ]
     
     def print_summary(self) -> None:
         """Print a summary of debug information if enabled."""
@@ -97,20 +153,24 @@ class DebugInfo:
         print(f"Maximum depth reached: {self.max_depth_reached}")
         
         print("\nDepth distribution:")
-        for depth in sorted(self.depth_counts.keys()):
-            print(f"  Depth {depth}: {self.depth_counts[depth]} nodes")
+        for depth, count in enumerate(self.depth_counts):
+            if count:
+                print(f"  Depth {depth}: {count} nodes")
+        
+        abbreviated_nodes = self.abbreviated_nodes
+        skipped_nodes = self.skipped_nodes
         
-        if self.abbreviated_nodes:
+        if abbreviated_nodes:
             print("\nAbbreviated nodes:")
-            for node_type, depth, chars_saved in self.abbreviated_nodes:
+            for node_type, depth, chars_saved in abbreviated_nodes:
                 print(f"  {node_type} at depth {depth} (saved {chars_saved} chars)")
         
-        if self.skipped_nodes:
+        if skipped_nodes:
             print("\nSkipped nodes:")
-            for node_type, depth, reason in self.skipped_nodes:
+            for node_type, depth, reason in skipped_nodes:
                 print(f"  {node_type} at depth {depth} - {reason}")
         
-        if not self.abbreviated_nodes and not self.skipped_nodes:
+        if not abbreviated_nodes and not skipped_nodes:
             print("\nNo nodes were abbreviated. Try:")
             print("  1. Decreasing the --depth parameter")
             print("  2. Using a file with deeper nesting")
@@ -118,6 +178,45 @@ class DebugInfo:
         print("------------------------\n")
 
 
+class _NullDebugInfo(DebugInfo):
+    """Debug info collector that records nothing, used when debug mode is off."""
+    
+    # Read-only stand-ins for the counters and collections DebugInfo keeps,
+    # shared by every instance since nothing is ever recorded
+    nodes_considered = 0
+    nodes_abbreviated = 0
+    nodes_skipped = 0
+    max_depth_reached = 0
+    depth_counts: Tuple[int, ...] = ()
+    chars_saved = 0
+    
+    def __init__(self):
+        """Initialize without any of the collections DebugInfo keeps."""
+        self.enabled = False
+    
+    @property
+    def abbreviated_nodes(self) -> List[Tuple[str, int, int]]:
+        """No abbreviated nodes are recorded."""
+        return []
+    
+    @property
+    def skipped_nodes(self) -> List[Tuple[str, int, str]]:
+        """No skipped nodes are recorded."""
+        return []
+    
+    def consider_node(self, node: cst.CSTNode, depth: int) -> None:
+        """Ignore a considered node."""
+    
+    def abbreviate_node(self, node: cst.CSTNode, depth: int, chars_saved: int) -> None:
+        """Ignore an abbreviated node."""
+    
+    def skip_node(self, node: cst.CSTNode, depth: int, reason: str) -> None:
+        """Ignore a skipped node."""
+    
+    def print_summary(self) -> None:
+        """Print nothing."""
+
+
 class CodeAbbreviator(cst.CSTTransformer):
     """
     A transformer that abbreviates nested code blocks beyond a specified depth.
@@ -127,7 +226,21 @@ class CodeAbbreviator(cst.CSTTransformer):
     but only if doing so reduces the character count.
     """
     
-    METADATA_DEPENDENCIES = (ParentNodeProvider, PositionProvider)
+    # Fields of each tracked node type that hold blocks to abbreviate
+    _BLOCK_FIELDS = {
+        cst.FunctionDef: ("body",),
+        cst.ClassDef: ("body",),
+        cst.If: ("body", "orelse"),
+        cst.While: ("body", "orelse"),
+        cst.For: ("body", "orelse"),
+        cst.Try: ("body", "handlers", "orelse", "finalbody"),
+        cst.With: ("body",),
+    }
+    _TRACKED = frozenset(_BLOCK_FIELDS)
+    
+    # Simple statements can't contain any tracked node, and they hold most
+    # of the nodes in a typical file, so their children are never traversed
+    _SIMPLE_STATEMENTS = frozenset({cst.SimpleStatementLine, cst.SimpleStatementSuite})
     
     def __init__(self, max_depth: int = 2, preserve_chars: int = 30, preserve_lines: int = 2, debug_info: Optional[DebugInfo] = None):
         """
@@ -144,8 +257,15 @@ class CodeAbbreviator(cst.CSTTransformer):
         self.preserve_chars = preserve_chars
         self.preserve_lines = preserve_lines
         self.current_depth = 0
-        self.stack = []
-        self.debug_info = debug_info or DebugInfo()
+        # (node, should abbreviate) for each tracked node being visited
+        self.stack: List[Tuple[cst.CSTNode, bool]] = []
+        self.debug_info = debug_info or _NullDebugInfo()
+        # Serialized lengths of original-tree nodes, keyed by id(); the
+        # original tree outlives the transform, so ids are not reused while it runs
+        self._len_cache: Dict[int, int] = {}
+        # Nodes are immutable, so every abbreviated block shares these
+        self._ellipsis = cst.EmptyLine(indent=True, comment=cst.Comment(value=_ELLIPSIS_COMMENT_VALUE))
+        self._pass = cst.SimpleStatementLine(body=[cst.Pass()])
     
     def _should_consider_abbreviation(self, node: cst.CSTNode) -> bool:
         """
@@ -159,6 +279,45 @@ class CodeAbbreviator(cst.CSTTransformer):
         """
         return self.current_depth > self.max_depth
     
+    def _code_len(self, node: cst.CSTNode) -> int:
+        """
+        Get the serialized length of a node from the original tree, memoized on its identity.
+        
+        Args:
+            node: The node to measure
+        
+        Returns:
+            Number of characters in the source code for the node
+        """
+        length = self._len_cache.get(id(node))
+        if length is None:
+            length = len(_EMPTY_MODULE.code_for_node(node))
+            self._len_cache[id(node)] = length
+        return length
+    
+    def _iter_block_code(self, body: cst.CSTNode) -> Iterator[str]:
+        """
+        Serialize a block piece by piece: its header, each statement, then its footer.
+        
+        Pieces are serialized on their own, so lines lack the block's
+        indentation, which previews strip anyway.
+        
+        Args:
+            body: The block to serialize
+        
+        Yields:
+            Code for each piece of the block, in order
+        """
+        if not isinstance(body, cst.IndentedBlock) or not body.body:
+            yield _EMPTY_MODULE.code_for_node(body)
+            return
+        
+        yield _EMPTY_MODULE.code_for_node(body.header)
+        for stmt in body.body:
+            yield _EMPTY_MODULE.code_for_node(stmt)
+        for line in body.footer:
+            yield _EMPTY_MODULE.code_for_node(line)
+    
     def _get_preview_comments(self, body: cst.IndentedBlock) -> List[cst.EmptyLine]:
         """
         Create preview comments for the first few lines of abbreviated code.
@@ -171,73 +330,39 @@ class CodeAbbreviator(cst.CSTTransformer):
         """
         preview_comments = []
         
-        # Get the code for the body
-        module = cst.Module([])
-        body_code = module.code_for_node(body)
-        
-        # Get lines of code
-        lines = body_code.splitlines()
-        
-        # Skip initial empty lines and collect non-empty lines
-        non_empty_lines = []
-        for line in lines:
-            if line.strip() or non_empty_lines:  # Start collecting once we hit a non-empty line
-                non_empty_lines.append(line)
-        
-        # Take only the first preserve_lines non-empty lines
+        # Serialize only as many leading statements as the preview needs
         count = 0
-        for line in non_empty_lines:
-            # Skip empty lines
-            if not line.strip():
-                continue
+        for piece in self._iter_block_code(body):
+            # splitlines() also breaks on \r, form feeds and other separators
+            for line in piece.splitlines():
+                # Skip empty lines
+                if not line.strip():
+                    continue
                 
-            # Preserve indentation in the comment
-            content = line.lstrip()
-            
-            # Truncate if needed
-            if len(content) > self.preserve_chars:
-                comment_text = f"# {content[:self.preserve_chars]}..."
-            else:
-                comment_text = f"# {content}"
+                # Preserve indentation in the comment
+                content = line.lstrip()
+                
+                # Truncate if needed
+                if len(content) > self.preserve_chars:
+                    comment_text = _PREVIEW_PREFIX + content[:self.preserve_chars] + "..."
+                else:
+                    comment_text = _PREVIEW_PREFIX + content
                 
-            # Add as a comment
-            preview_comments.append(
-                cst.EmptyLine(
-                    indent=True,
-                    comment=cst.Comment(value=comment_text)
+                # Add as a comment
+                preview_comments.append(
+                    cst.EmptyLine(
+                        indent=True,
+                        comment=cst.Comment(value=comment_text)
+                    )
                 )
-            )
-            
-            # Increment counter and check if we've reached the limit
-            count += 1
-            if count >= self.preserve_lines:
-                break
+                
+                # Increment counter and check if we've reached the limit
+                count += 1
+                if count >= self.preserve_lines:
+                    return preview_comments
         
         return preview_comments
     
-    def _get_ellipsis_comment(self) -> cst.EmptyLine:
-        """
-        Create an ellipsis comment for abbreviated code.
-        
-        Returns:
-            An EmptyLine node with a trailing comment containing ellipsis
-        """
-        return cst.EmptyLine(
-            indent=True,
-            comment=cst.Comment(value="# ...")
-        )
-    
-    def _get_pass_statement(self) -> cst.SimpleStatementLine:
-        """
-        Create a pass statement for abbreviated code.
-        
-        Returns:
-            A SimpleStatementLine containing a Pass node
-        """
-        return cst.SimpleStatementLine(
-            body=[cst.Pass()],
-        )
-    
     def _create_abbreviated_block(self, body: cst.IndentedBlock) -> cst.IndentedBlock:
         """
         Create an abbreviated indented block with preview of original code.
@@ -253,425 +378,323 @@ class CodeAbbreviator(cst.CSTTransformer):
         
         # Create block with preview, ellipsis, and pass statement
         return cst.IndentedBlock(
-            body=preview_comments + [self._get_ellipsis_comment(), self._get_pass_statement()]
+            body=preview_comments + [self._ellipsis, self._pass]
         )
     
-    def _is_abbreviation_beneficial(self, original_node: cst.CSTNode, abbreviated_node: cst.CSTNode) -> Tuple[bool, int]:
+    def _abbreviated_len(self, node: Union[cst.IndentedBlock, cst.Else]) -> int:
         """
-        Check if abbreviating a node actually reduces its character count.
+        Compute the serialized length of a node built from _create_abbreviated_block.
         
-        Args:
-            original_node: The original node
-            abbreviated_node: The abbreviated version of the node
-            
-        Returns:
-            Tuple[bool, int]: A tuple of (is_beneficial, chars_saved)
-        """
-        original_code = cst.Module([]).code_for_node(original_node)
-        abbreviated_code = cst.Module([]).code_for_node(abbreviated_node)
-        
-        chars_saved = len(original_code) - len(abbreviated_code)
-        return chars_saved > 0, chars_saved
-    
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> Optional[bool]:
-        """
-        Visit a function definition node and track depth.
+        The block has a bare newline header and every line is indented by the
+        default four spaces, so its length follows from the comments alone.
         
         Args:
-            node: The FunctionDef node being visited
-            
-        Returns:
-            Optional[bool]: Whether to continue traversal
-        """
-        self.current_depth += 1
-        self.stack.append(node)
-        self.debug_info.consider_node(node, self.current_depth)
-        return not self._should_consider_abbreviation(node)
-    
-    def leave_FunctionDef(
-        self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef
-    ) -> cst.FunctionDef:
-        """
-        Leave a function definition node and potentially abbreviate its body.
+            node: An abbreviated block, or a new Else wrapping one
         
-        Args:
-            original_node: The original FunctionDef node
-            updated_node: The updated FunctionDef node
-            
         Returns:
-            cst.FunctionDef: The potentially modified FunctionDef node
+            Number of characters code_for_node would produce for the node
         """
-        result = updated_node
+        if isinstance(node, cst.Else):
+            # "else:" followed by the block
+            return 5 + self._abbreviated_len(node.body)
         
-        if self._should_consider_abbreviation(original_node):
-            # Create an abbreviated version of this function
-            abbreviated_node = updated_node.with_changes(
-                body=self._create_abbreviated_block(original_node.body)
-            )
-            
-            # Check if abbreviation actually saves characters
-            is_beneficial, chars_saved = self._is_abbreviation_beneficial(updated_node, abbreviated_node)
-            
-            if is_beneficial:
-                result = abbreviated_node
-                self.debug_info.abbreviate_node(original_node, self.current_depth, chars_saved)
+        length = 1  # Header newline
+        for line in node.body:
+            if isinstance(line, cst.EmptyLine):
+                length += 4 + len(line.comment.value) + 1
             else:
-                self.debug_info.skip_node(original_node, self.current_depth, "No character reduction")
-        
-        self.current_depth -= 1
-        self.stack.pop()
-        return result
+                length += 4 + len("pass") + 1
+        return length
     
-    def visit_ClassDef(self, node: cst.ClassDef) -> Optional[bool]:
+    def _is_abbreviation_beneficial(
+        self, replacements: List[Tuple[cst.CSTNode, cst.CSTNode]]
+    ) -> Tuple[bool, int]:
         """
-        Visit a class definition node and track depth.
+        Check if abbreviating a node actually reduces its character count.
         
-        Args:
-            node: The ClassDef node being visited
-            
-        Returns:
-            Optional[bool]: Whether to continue traversal
-        """
-        self.current_depth += 1
-        self.stack.append(node)
-        self.debug_info.consider_node(node, self.current_depth)
-        return not self._should_consider_abbreviation(node)
-    
-    def leave_ClassDef(
-        self, original_node: cst.ClassDef, updated_node: cst.ClassDef
-    ) -> cst.ClassDef:
-        """
-        Leave a class definition node and potentially abbreviate its body.
+        Everything outside the swapped parts is unchanged by abbreviation, so
+        only those parts are compared and the node itself is never serialized.
         
         Args:
-            original_node: The original ClassDef node
-            updated_node: The updated ClassDef node
+            replacements: (original child, abbreviated replacement) pairs that
+                abbreviation would swap into the node
             
         Returns:
-            cst.ClassDef: The potentially modified ClassDef node
+            Tuple[bool, int]: A tuple of (is_beneficial, chars_saved)
         """
-        result = updated_node
-        
-        if self._should_consider_abbreviation(original_node):
-            # Create an abbreviated version of this class
-            abbreviated_node = updated_node.with_changes(
-                body=self._create_abbreviated_block(original_node.body)
-            )
-            
-            # Check if abbreviation actually saves characters
-            is_beneficial, chars_saved = self._is_abbreviation_beneficial(updated_node, abbreviated_node)
-            
-            if is_beneficial:
-                result = abbreviated_node
-                self.debug_info.abbreviate_node(original_node, self.current_depth, chars_saved)
-            else:
-                self.debug_info.skip_node(original_node, self.current_depth, "No character reduction")
+        replaced_len = sum(self._child_len(old) for old, _ in replacements)
+        new_len = sum(self._abbreviated_len(new) for _, new in replacements)
         
-        self.current_depth -= 1
-        self.stack.pop()
-        return result
+        chars_saved = replaced_len - new_len
+        return chars_saved > 0, chars_saved
     
-    def visit_If(self, node: cst.If) -> Optional[bool]:
+    def _child_len(self, node: cst.CSTNode) -> int:
         """
-        Visit an if statement node and track depth.
+        Get the length a child of a tracked node has in its parent's code.
         
         Args:
-            node: The If node being visited
-            
-        Returns:
-            Optional[bool]: Whether to continue traversal
-        """
-        self.current_depth += 1
-        self.stack.append(node)
-        self.debug_info.consider_node(node, self.current_depth)
-        return not self._should_consider_abbreviation(node)
-    
-    def leave_If(
-        self, original_node: cst.If, updated_node: cst.If
-    ) -> cst.If:
-        """
-        Leave an if statement node and potentially abbreviate its body.
+            node: A child that abbreviation would replace
         
-        Args:
-            original_node: The original If node
-            updated_node: The updated If node
-            
         Returns:
-            cst.If: The potentially modified If node
+            Number of characters the child contributes to its parent
         """
-        result = updated_node
-        
-        if self._should_consider_abbreviation(original_node):
-            # Create an abbreviated version of this if statement
-            abbreviated_node = updated_node.with_changes(
-                body=self._create_abbreviated_block(original_node.body)
-            )
-            
-            # If there's an else clause, abbreviate that too
-            if updated_node.orelse:
-                if isinstance(updated_node.orelse, cst.Else):
-                    abbreviated_node = abbreviated_node.with_changes(
-                        orelse=updated_node.orelse.with_changes(
-                            body=self._create_abbreviated_block(original_node.orelse.body)
-                        )
-                    )
-                else:
-                    # Handle elif chains by converting them to a simple else
-                    abbreviated_node = abbreviated_node.with_changes(
-                        orelse=cst.Else(
-                            body=self._create_abbreviated_block(original_node.orelse.body)
-                        )
-                    )
-            
-            # Check if abbreviation actually saves characters
-            is_beneficial, chars_saved = self._is_abbreviation_beneficial(updated_node, abbreviated_node)
-            
-            if is_beneficial:
-                result = abbreviated_node
-                self.debug_info.abbreviate_node(original_node, self.current_depth, chars_saved)
-            else:
-                self.debug_info.skip_node(original_node, self.current_depth, "No character reduction")
-        
-        self.current_depth -= 1
-        self.stack.pop()
-        return result
+        length = self._code_len(node)
+        if isinstance(node, cst.If):
+            # An elif serializes on its own as "if", two characters short
+            length += 2
+        return length
     
-    def visit_While(self, node: cst.While) -> Optional[bool]:
+    def _original_blocks(self, original_node: cst.CSTNode) -> List[cst.CSTNode]:
         """
-        Visit a while loop node and track depth.
+        Get the children of a node that abbreviation would replace.
         
         Args:
-            node: The While node being visited
-            
-        Returns:
-            Optional[bool]: Whether to continue traversal
-        """
-        self.current_depth += 1
-        self.stack.append(node)
-        self.debug_info.consider_node(node, self.current_depth)
-        return not self._should_consider_abbreviation(node)
-    
-    def leave_While(
-        self, original_node: cst.While, updated_node: cst.While
-    ) -> cst.While:
-        """
-        Leave a while loop node and potentially abbreviate its body.
+            original_node: The node being abbreviated
         
-        Args:
-            original_node: The original While node
-            updated_node: The updated While node
-            
         Returns:
-            cst.While: The potentially modified While node
+            The original blocks, else clauses and finally clauses of the node
         """
-        result = updated_node
-        
-        if self._should_consider_abbreviation(original_node):
-            # Create an abbreviated version of this while loop
-            abbreviated_node = updated_node.with_changes(
-                body=self._create_abbreviated_block(original_node.body)
-            )
-            
-            # If there's an else clause, abbreviate that too
-            if updated_node.orelse:
-                abbreviated_node = abbreviated_node.with_changes(
-                    orelse=updated_node.orelse.with_changes(
-                        body=self._create_abbreviated_block(original_node.orelse.body)
-                    )
-                )
-            
-            # Check if abbreviation actually saves characters
-            is_beneficial, chars_saved = self._is_abbreviation_beneficial(updated_node, abbreviated_node)
-            
-            if is_beneficial:
-                result = abbreviated_node
-                self.debug_info.abbreviate_node(original_node, self.current_depth, chars_saved)
+        blocks = []
+        for field in self._BLOCK_FIELDS[type(original_node)]:
+            value = getattr(original_node, field)
+            if not value:
+                continue
+            if field == "handlers":
+                blocks.extend(handler.body for handler in value)
+            elif field == "orelse" and isinstance(value, cst.Else):
+                blocks.append(value.body)
             else:
-                self.debug_info.skip_node(original_node, self.current_depth, "No character reduction")
-        
-        self.current_depth -= 1
-        self.stack.pop()
-        return result
+                blocks.append(value)
+        return blocks
     
-    def visit_For(self, node: cst.For) -> Optional[bool]:
+    def _abbreviate_field(
+        self,
+        original_node: cst.CSTNode,
+        field: str,
+        changes: Dict[str, object],
+        replacements: List[Tuple[cst.CSTNode, cst.CSTNode]]
+    ) -> None:
         """
-        Visit a for loop node and track depth.
+        Build the abbreviated replacement for one block-holding field of a node.
         
         Args:
-            node: The For node being visited
-            
-        Returns:
-            Optional[bool]: Whether to continue traversal
+            original_node: The node being abbreviated
+            field: Name of the field, one of _BLOCK_FIELDS
+            changes: with_changes arguments to add the replacement to
+            replacements: (original child, replacement) pairs for the benefit check
         """
-        self.current_depth += 1
-        self.stack.append(node)
-        self.debug_info.consider_node(node, self.current_depth)
-        return not self._should_consider_abbreviation(node)
+        value = getattr(original_node, field)
+        if not value:
+            return
+        
+        if field == "handlers":
+            handlers = []
+            for handler in value:
+                handler_body = self._create_abbreviated_block(handler.body)
+                handlers.append(handler.with_changes(body=handler_body))
+                replacements.append((handler.body, handler_body))
+            changes[field] = handlers
+        elif field == "orelse":
+            orelse_body = self._create_abbreviated_block(value.body)
+            if isinstance(value, cst.If):
+                # Handle elif chains by converting them to a simple else
+                changes[field] = cst.Else(body=orelse_body)
+                replacements.append((value, changes[field]))
+            else:
+                changes[field] = value.with_changes(body=orelse_body)
+                replacements.append((value.body, orelse_body))
+        else:
+            # body, or finalbody whose Finally clause is replaced as a whole
+            changes[field] = self._create_abbreviated_block(value)
+            replacements.append((value, changes[field]))
     
-    def leave_For(
-        self, original_node: cst.For, updated_node: cst.For
-    ) -> cst.For:
+    def _leave_block(self, original_node: cst.CSTNode, updated_node: cst.CSTNode) -> cst.CSTNode:
         """
-        Leave a for loop node and potentially abbreviate its body.
+        Leave a tracked node and potentially abbreviate its blocks.
         
         Args:
-            original_node: The original For node
-            updated_node: The updated For node
+            original_node: The original node
+            updated_node: The updated node
             
         Returns:
-            cst.For: The potentially modified For node
+            cst.CSTNode: The potentially modified node
         """
         result = updated_node
         
-        if self._should_consider_abbreviation(original_node):
-            # Create an abbreviated version of this for loop
-            abbreviated_node = updated_node.with_changes(
-                body=self._create_abbreviated_block(original_node.body)
-            )
-            
-            # If there's an else clause, abbreviate that too
-            if updated_node.orelse:
-                abbreviated_node = abbreviated_node.with_changes(
-                    orelse=updated_node.orelse.with_changes(
-                        body=self._create_abbreviated_block(original_node.orelse.body)
-                    )
-                )
+        # Use the decision made on the way down, before the children ran
+        _, should_abbreviate = self.stack[-1]
+        if should_abbreviate:
+            is_beneficial, chars_saved = False, 0
             
-            # Check if abbreviation actually saves characters
-            is_beneficial, chars_saved = self._is_abbreviation_beneficial(updated_node, abbreviated_node)
+            # Blocks no longer than the shortest abbreviated block can't save
+            # anything, so only build previews for larger ones
+            blocks = self._original_blocks(original_node)
+            if sum(self._child_len(block) for block in blocks) > _MIN_ABBREVIATED_LEN * len(blocks):
+                # Create abbreviated versions of each block of this node
+                changes: Dict[str, object] = {}
+                replacements: List[Tuple[cst.CSTNode, cst.CSTNode]] = []
+                for field in self._BLOCK_FIELDS[type(original_node)]:
+                    self._abbreviate_field(original_node, field, changes, replacements)
+                
+                # Check if abbreviation actually saves characters
+                is_beneficial, chars_saved = self._is_abbreviation_beneficial(replacements)
             
             if is_beneficial:
-                result = abbreviated_node
+                result = updated_node.with_changes(**changes)
                 self.debug_info.abbreviate_node(original_node, self.current_depth, chars_saved)
             else:
                 self.debug_info.skip_node(original_node, self.current_depth, "No character reduction")
         
-        self.current_depth -= 1
-        self.stack.pop()
+        self._exit_node()
         return result
     
-    def visit_Try(self, node: cst.Try) -> Optional[bool]:
+    def _enter_node(self, node: cst.CSTNode) -> bool:
         """
-        Visit a try statement node and track depth.
+        Track entering a node, the same way for every tracked node type.
         
         Args:
-            node: The Try node being visited
-            
+            node: The node being visited
+        
         Returns:
-            Optional[bool]: Whether to continue traversal
+            bool: Whether the node should be considered for abbreviation
         """
         self.current_depth += 1
-        self.stack.append(node)
+        should_abbreviate = self._should_consider_abbreviation(node)
+        self.stack.append((node, should_abbreviate))
         self.debug_info.consider_node(node, self.current_depth)
-        return not self._should_consider_abbreviation(node)
+        return should_abbreviate
     
-    def leave_Try(
-        self, original_node: cst.Try, updated_node: cst.Try
-    ) -> cst.Try:
-        """
-        Leave a try statement node and potentially abbreviate its body.
-        
-        Args:
-            original_node: The original Try node
-            updated_node: The updated Try node
-            
-        Returns:
-            cst.Try: The potentially modified Try node
-        """
-        result = updated_node
-        
-        if self._should_consider_abbreviation(original_node):
-            # Create an abbreviated version of this try statement
-            abbreviated_node = updated_node.with_changes(
-                body=self._create_abbreviated_block(original_node.body)
-            )
-            
-            # Abbreviate handlers
-            if updated_node.handlers:
-                handlers = []
-                for i, handler in enumerate(updated_node.handlers):
-                    handlers.append(
-                        handler.with_changes(
-                            body=self._create_abbreviated_block(original_node.handlers[i].body)
-                        )
-                    )
-                abbreviated_node = abbreviated_node.with_changes(handlers=handlers)
-            
-            # Abbreviate else clause if present
-            if updated_node.orelse:
-                abbreviated_node = abbreviated_node.with_changes(
-                    orelse=updated_node.orelse.with_changes(
-                        body=self._create_abbreviated_block(original_node.orelse.body)
-                    )
-                )
-            
-            # Abbreviate finally clause if present
-            if updated_node.finalbody:
-                abbreviated_node = abbreviated_node.with_changes(
-                    finalbody=self._create_abbreviated_block(original_node.finalbody)
-                )
-            
-            # Check if abbreviation actually saves characters
-            is_beneficial, chars_saved = self._is_abbreviation_beneficial(updated_node, abbreviated_node)
-            
-            if is_beneficial:
-                result = abbreviated_node
-                self.debug_info.abbreviate_node(original_node, self.current_depth, chars_saved)
-            else:
-                self.debug_info.skip_node(original_node, self.current_depth, "No character reduction")
-        
+    def _exit_node(self) -> None:
+        """Track leaving a node entered with _enter_node."""
         self.current_depth -= 1
         self.stack.pop()
-        return result
     
-    def visit_With(self, node: cst.With) -> Optional[bool]:
+    def on_visit(self, node: cst.CSTNode) -> bool:
         """
-        Visit a with statement node and track depth.
+        Visit any node, tracking depth for the node types in _TRACKED.
+        
+        This replaces LibCST's per-type visit_* lookup with one set check.
         
         Args:
-            node: The With node being visited
+            node: The node being visited
             
         Returns:
-            Optional[bool]: Whether to continue traversal
+            bool: Whether to continue traversal into the node's children
         """
-        self.current_depth += 1
-        self.stack.append(node)
-        self.debug_info.consider_node(node, self.current_depth)
-        return not self._should_consider_abbreviation(node)
+        node_type = type(node)
+        if node_type in self._TRACKED:
+            return not self._enter_node(node)
+        return node_type not in self._SIMPLE_STATEMENTS
     
-    def leave_With(
-        self, original_node: cst.With, updated_node: cst.With
-    ) -> cst.With:
+    def on_leave(self, original_node: cst.CSTNode, updated_node: cst.CSTNode) -> cst.CSTNode:
         """
-        Leave a with statement node and potentially abbreviate its body.
+        Leave any node, potentially abbreviating the node types in _TRACKED.
         
         Args:
-            original_node: The original With node
-            updated_node: The updated With node
+            original_node: The original node
+            updated_node: The updated node
             
         Returns:
-            cst.With: The potentially modified With node
+            cst.CSTNode: The potentially modified node
         """
-        result = updated_node
-        
-        if self._should_consider_abbreviation(original_node):
-            # Create an abbreviated version of this with statement
-            abbreviated_node = updated_node.with_changes(
-                body=self._create_abbreviated_block(original_node.body)
-            )
-            
-            # Check if abbreviation actually saves characters
-            is_beneficial, chars_saved = self._is_abbreviation_beneficial(updated_node, abbreviated_node)
-            
-            if is_beneficial:
-                result = abbreviated_node
-                self.debug_info.abbreviate_node(original_node, self.current_depth, chars_saved)
-            else:
-                self.debug_info.skip_node(original_node, self.current_depth, "No character reduction")
-        
-        self.current_depth -= 1
-        self.stack.pop()
-        return result
+        if type(original_node) in self._TRACKED:
+            return self._leave_block(original_node, updated_node)
+        return updated_node
+    
+    def on_visit_attribute(self, node: cst.CSTNode, attribute: str) -> None:
+        """Skip LibCST's per-attribute visit_* lookup; no attribute hooks are used."""
+    
+    def on_leave_attribute(self, original_node: cst.CSTNode, attribute: str) -> None:
+        """Skip LibCST's per-attribute leave_* lookup; no attribute hooks are used."""
+
+def _abbreviate_module(module: cst.Module, max_depth: int, preserve_chars: int, preserve_lines: int, debug_info: DebugInfo) -> cst.Module:
+    """
+    Run CodeAbbreviator over a parsed module.
+    
+    Args:
+        module: The parsed Python module
+        max_depth: Maximum nesting depth to preserve
+        preserve_chars: Number of characters to preserve per line
+        preserve_lines: Number of lines to preserve
+        debug_info: Debug information collector
+    
+    Returns:
+        cst.Module: The abbreviated module
+    """
+    transformer = CodeAbbreviator(
+        max_depth=max_depth,
+        preserve_chars=preserve_chars,
+        preserve_lines=preserve_lines,
+        debug_info=debug_info
+    )
+    return module.visit(transformer)
+
+
+def _transform_code(code: str, max_depth: int, preserve_chars: int, preserve_lines: int, debug_info: DebugInfo) -> str:
+    """
+    Parse code and run CodeAbbreviator over it.
+    
+    Args:
+        code: The Python code to abbreviate
+        max_depth: Maximum nesting depth to preserve
+        preserve_chars: Number of characters to preserve per line
+        preserve_lines: Number of lines to preserve
+        debug_info: Debug information collector
+    
+    Returns:
+        str: The abbreviated code
+    """
+    # Parse the code into a CST
+    module = cst.parse_module(code)
+    
+    # Apply our transformer to abbreviate deeply nested code
+    modified_module = _abbreviate_module(module, max_depth, preserve_chars, preserve_lines, debug_info)
+    
+    # Generate the abbreviated code
+    return modified_module.code
+
+
+def _write_module(module: cst.Module, f: TextIO) -> int:
+    """
+    Write a module's code to a file one top-level statement at a time.
+    
+    This produces the same text as module.code without ever holding all
+    of it in memory.
+    
+    Args:
+        module: The module to write
+        f: Text file to write to
+    
+    Returns:
+        int: Number of characters written
+    """
+    written = 0
+    pending = ""
+    for node in itertools.chain(module.header, module.body, module.footer):
+        f.write(pending)
+        written += len(pending)
+        pending = module.code_for_node(node)
+    
+    # Module.code drops the newline ending the last line of a file without
+    # one, and writes a lone newline for an empty file that has one
+    if not module.has_trailing_newline:
+        pending = pending[:-2] if pending.endswith("\r\n") else pending[:-1]
+    elif not written and not pending:
+        pending = module.default_newline
+    
+    f.write(pending)
+    return written + len(pending)
+
+
+@functools.lru_cache(maxsize=128)
+def _abbreviate_code_cached(code: str, max_depth: int, preserve_chars: int, preserve_lines: int) -> str:
+    """
+    Abbreviate code without debug output, memoized on the arguments.
+    
+    Exceptions are not cached, so a failing input is retried (and reported)
+    on every call.
+    """
+    return _transform_code(code, max_depth, preserve_chars, preserve_lines, _NullDebugInfo())
 
 
 def abbreviate_code(code: str, max_depth: int = 2, preserve_chars: int = 30, preserve_lines: int = 2, debug: bool = False) -> str:
@@ -689,26 +712,19 @@ def abbreviate_code(code: str, max_depth: int = 2, preserve_chars: int = 30, pre
         str: The abbreviated code
     """
     try:
-        # Set up debug info collector
-        debug_info = DebugInfo(enabled=debug)
+        # Repeated requests for the same code are served from the cache;
+        # debug runs always transform so the summary reflects this call
+        if not debug:
+            return _abbreviate_code_cached(code, max_depth, preserve_chars, preserve_lines)
         
-        # Parse the code into a CST
-        module = cst.parse_module(code)
-        
-        # Apply our transformer to abbreviate deeply nested code
-        transformer = CodeAbbreviator(
-            max_depth=max_depth,
-            preserve_chars=preserve_chars,
-            preserve_lines=preserve_lines,
-            debug_info=debug_info
-        )
-        modified_module = module.visit(transformer)
+        # Set up debug info collector
+        debug_info = DebugInfo(enabled=True)
+        abbreviated_code = _transform_code(code, max_depth, preserve_chars, preserve_lines, debug_info)
         
-        # Print debug information if requested
+        # Print debug information
         debug_info.print_summary()
         
-        # Generate the abbreviated code
-        return modified_module.code
+        return abbreviated_code
     except Exception as e:
         print(f"Error abbreviating code: {e}", file=sys.stderr)
         import traceback
@@ -716,7 +732,177 @@ def abbreviate_code(code: str, max_depth: int = 2, preserve_chars: int = 30, pre
         return code
 
 
-def abbreviate_file(input_file: str, max_depth: int = 2, preserve_chars: int = 30, preserve_lines: int = 2, debug: bool = False) -> Tuple[str, int, int, int, float]:
+# ast counterparts of the statements CodeAbbreviator tracks
+_AST_TRACKED = (
+    ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.If, ast.While,
+    ast.For, ast.AsyncFor, ast.Try, ast.With, ast.AsyncWith
+)
+
+
+class _FastPathUnsupported(Exception):
+    """Raised when abbreviate_code_fast can't edit the source text safely."""
+
+
+def _ast_blocks(node: ast.AST) -> Iterator[List[ast.stmt]]:
+    """
+    Get the statement lists nested directly inside an ast statement.
+    
+    Args:
+        node: The statement
+    
+    Yields:
+        Each body, else, except, finally and match case block of the statement
+    """
+    for field in ("body", "orelse", "finalbody"):
+        block = getattr(node, field, None)
+        if isinstance(block, list) and block and isinstance(block[0], ast.stmt):
+            yield block
+    for handler in getattr(node, "handlers", ()):
+        yield handler.body
+    for case in getattr(node, "cases", ()):
+        yield case.body
+
+
+def _fast_block_edit(
+    lines: List[str], block: List[ast.stmt], preserve_chars: int, preserve_lines: int
+) -> Tuple[int, int, List[str]]:
+    """
+    Build the source edit that abbreviates one block.
+    
+    Args:
+        lines: Source lines, with line endings
+        block: Statements of the block
+        preserve_chars: Number of characters to preserve per line
+        preserve_lines: Number of lines to preserve
+    
+    Returns:
+        Tuple of (first line index, end line index, replacement lines)
+    """
+    first = block[0]
+    start = min([first.lineno] + [d.lineno for d in getattr(first, "decorator_list", ())]) - 1
+    end = block[-1].end_lineno
+    
+    # Only blocks that start on their own line can be swapped line by line
+    indent = lines[start][:len(lines[start]) - len(lines[start].lstrip())]
+    if len(indent) != first.col_offset or start == 0:
+        raise _FastPathUnsupported()
+    
+    replacement = []
+    for line in itertools.islice(lines, start, end):
+        content = line.strip()
+        if not content:
+            continue
+        if len(content) > preserve_chars:
+            replacement.append(indent + _PREVIEW_PREFIX + content[:preserve_chars] + "...\n")
+        else:
+            replacement.append(indent + _PREVIEW_PREFIX + content + "\n")
+        if len(replacement) >= preserve_lines:
+            break
+    
+    replacement.append(indent + _ELLIPSIS_COMMENT_VALUE + "\n")
+    replacement.append(indent + "pass\n")
+    return start, end, replacement
+
+
+def abbreviate_code_fast(code: str, max_depth: int = 2, preserve_chars: int = 30, preserve_lines: int = 2) -> str:
+    """
+    Abbreviate nested blocks using the stdlib ast module instead of LibCST.
+    
+    Depth is counted over the same statements as CodeAbbreviator, and each
+    block beyond max_depth is swapped for preview comments, an ellipsis
+    comment and a pass statement when that shortens it. The edits are made
+    on the source lines, so everything outside abbreviated blocks is kept
+    verbatim. Previews come from the block's own lines (a comment after
+    the colon isn't previewed) and sizes are compared at the block's real
+    indentation, so results can differ slightly from abbreviate_code.
+    Blocks written on their header line are left as they are, and code
+    whose edits would overlap or that ast can't parse is handed to
+    abbreviate_code instead.
+    
+    Args:
+        code: The Python code to abbreviate
+        max_depth: Maximum nesting depth to preserve (default: 2)
+        preserve_chars: Number of characters to preserve per line (default: 10)
+        preserve_lines: Number of lines to preserve (default: 2)
+    
+    Returns:
+        str: The abbreviated code
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return abbreviate_code(code, max_depth, preserve_chars, preserve_lines)
+    
+    # Split on the same line breaks the tokenizer counts, keeping endings
+    lines = io.StringIO(code, newline="").readlines()
+    edits: List[Tuple[int, int, List[str]]] = []
+    
+    def abbreviate_node(node: ast.stmt) -> None:
+        node_edits = []
+        try:
+            for block in _ast_blocks(node):
+                if block is getattr(node, "orelse", None) and isinstance(node, ast.If) and \
+                        isinstance(block[0], ast.If) and lines[block[0].lineno - 1].lstrip().startswith("elif"):
+                    # Handle elif chains by converting them to a simple else
+                    _, _, replacement = _fast_block_edit(lines, block[0].body, preserve_chars, preserve_lines)
+                    header = lines[block[0].lineno - 1]
+                    else_line = header[:len(header) - len(header.lstrip())] + "else:\n"
+                    node_edits.append((block[0].lineno - 1, block[-1].end_lineno, [else_line] + replacement))
+                else:
+                    node_edits.append(_fast_block_edit(lines, block, preserve_chars, preserve_lines))
+        except _FastPathUnsupported:
+            # Leave statements with a block on their header line as they are
+            return
+        
+        # Check if abbreviation actually saves characters
+        original_len = sum(len(line) for start, end, _ in node_edits for line in lines[start:end])
+        abbreviated_len = sum(len(line) for _, _, replacement in node_edits for line in replacement)
+        if abbreviated_len < original_len:
+            edits.extend(node_edits)
+    
+    def walk(stmts: List[ast.stmt], depth: int) -> None:
+        for node in stmts:
+            if isinstance(node, _AST_TRACKED):
+                if depth + 1 > max_depth:
+                    abbreviate_node(node)
+                    continue
+                child_depth = depth + 1
+            else:
+                child_depth = depth
+            for block in _ast_blocks(node):
+                walk(block, child_depth)
+    
+    try:
+        walk(tree.body, 0)
+        
+        # Splice the edits into the source lines
+        output = []
+        pos = 0
+        for start, end, replacement in sorted(edits):
+            if start < pos:
+                raise _FastPathUnsupported()
+            output.extend(lines[pos:start])
+            output.extend(replacement)
+            pos = end
+        output.extend(lines[pos:])
+        
+        # Keep a missing final newline missing
+        if pos == len(lines) and lines and not lines[-1].endswith(("\n", "\r")):
+            output[-1] = output[-1][:-1]
+    except _FastPathUnsupported:
+        return abbreviate_code(code, max_depth, preserve_chars, preserve_lines)
+    
+    return "".join(output)
+
+
+def abbreviate_file(
+    input_file: str,
+    max_depth: int = 2,
+    preserve_chars: int = 30,
+    preserve_lines: int = 2,
+    debug: bool = False,
+    fast: bool = False
+) -> Tuple[str, int, int, int, float]:
     """
     Abbreviate a Python file, save the output, and return statistics.
     
@@ -725,7 +911,8 @@ def abbreviate_file(input_file: str, max_depth: int = 2, preserve_chars: int = 3
         max_depth: Maximum nesting depth to preserve
         preserve_chars: Number of characters to preserve per line (default: 10)
         preserve_lines: Number of lines to preserve (default: 2)
-        debug: Whether to print debug information
+        debug: Whether to print debug information (ignored with fast)
+        fast: Whether to use abbreviate_code_fast instead of LibCST
         
     Returns:
         Tuple containing:
@@ -738,21 +925,59 @@ def abbreviate_file(input_file: str, max_depth: int = 2, preserve_chars: int = 3
     # Read the input file
     with open(input_file, "r", encoding="utf-8") as f:
         code = f.read()
-    
-    # Abbreviate the code
-    abbreviated_code = abbreviate_code(code, max_depth, preserve_chars, preserve_lines, debug)
+    original_chars = len(code)
     
     # Generate the output file name
     base_name, ext = os.path.splitext(input_file)
     output_file = f"{base_name}.abbreviated{ext}"
     
-    # Write the abbreviated code to the output file
+    if fast:
+        if debug:
+            print("Debug summary is not available with the fast abbreviation path", file=sys.stderr)
+        abbreviated = abbreviate_code_fast(code, max_depth, preserve_chars, preserve_lines)
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(abbreviated)
+        abbreviated_chars = len(abbreviated)
+        return _report_file_stats(output_file, original_chars, abbreviated_chars)
+    
+    # Abbreviate the code, keeping the CST rather than rendering it to a string
+    try:
+        debug_info = DebugInfo(enabled=True) if debug else _NullDebugInfo()
+        module = _abbreviate_module(cst.parse_module(code), max_depth, preserve_chars, preserve_lines, debug_info)
+        debug_info.print_summary()
+    except Exception as e:
+        print(f"Error abbreviating code: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        module = None
+    
+    # Write the abbreviated code to the output file, falling back to the
+    # original code as abbreviate_code does
     with open(output_file, "w", encoding="utf-8") as f:
-        f.write(abbreviated_code)
+        if module is None:
+            f.write(code)
+            abbreviated_chars = original_chars
+        else:
+            # The CST holds everything needed from here on
+            del code
+            abbreviated_chars = _write_module(module, f)
     
+    return _report_file_stats(output_file, original_chars, abbreviated_chars)
+
+
+def _report_file_stats(output_file: str, original_chars: int, abbreviated_chars: int) -> Tuple[str, int, int, int, float]:
+    """
+    Print and return the statistics of an abbreviated file.
+    
+    Args:
+        output_file: Path the abbreviated code was written to
+        original_chars: Character count of the original code
+        abbreviated_chars: Character count of the abbreviated code
+    
+    Returns:
+        The abbreviate_file result tuple
+    """
     # Calculate statistics
-    original_chars = len(code)
-    abbreviated_chars = len(abbreviated_code)
     chars_saved = original_chars - abbreviated_chars
     percent_saved = (chars_saved / original_chars) * 100 if original_chars > 0 else 0
     
@@ -764,6 +989,51 @@ def abbreviate_file(input_file: str, max_depth: int = 2, preserve_chars: int = 3
     return output_file, original_chars, abbreviated_chars, chars_saved, percent_saved
 
 
+def abbreviate_files(
+    input_files: List[str],
+    max_depth: int = 2,
+    preserve_chars: int = 30,
+    preserve_lines: int = 2,
+    debug: bool = False,
+    max_workers: Optional[int] = None,
+    fast: bool = False
+) -> List[Tuple[str, int, int, int, float]]:
+    """
+    Abbreviate several Python files in parallel, one worker process per CPU.
+    
+    Each worker parses its own file, so no CST crosses a process boundary.
+    A single file is abbreviated in this process.
+    
+    Args:
+        input_files: Paths to the Python files to abbreviate
+        max_depth: Maximum nesting depth to preserve
+        preserve_chars: Number of characters to preserve per line (default: 10)
+        preserve_lines: Number of lines to preserve (default: 2)
+        debug: Whether to print debug information
+        max_workers: Number of worker processes (default: CPU count)
+        fast: Whether to use abbreviate_code_fast instead of LibCST
+    
+    Returns:
+        List of abbreviate_file results, in the order of input_files
+    """
+    if len(input_files) <= 1:
+        return [abbreviate_file(path, max_depth, preserve_chars, preserve_lines, debug, fast) for path in input_files]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    n = len(input_files)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(
+            abbreviate_file,
+            input_files,
+            [max_depth] * n,
+            [preserve_chars] * n,
+            [preserve_lines] * n,
+            [debug] * n,
+            [fast] * n
+        ))
+
+
 if __name__ == "__main__":
     import argparse
     
@@ -771,10 +1041,10 @@ if __name__ == "__main__":
         description="Abbreviate nested Python code beyond a specified depth if it reduces character count."
     )
     parser.add_argument(
-        "input_file",
-        nargs="?",
-        default=__file__,
-        help="Path to the Python file to abbreviate (default: this script)"
+        "input_files",
+        nargs="*",
+        default=[__file__],
+        help="Paths to the Python files to abbreviate (default: this script)"
     )
     parser.add_argument(
         "--depth",
@@ -799,6 +1069,19 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable debug output"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Use the stdlib ast abbreviation path (faster, output can differ slightly)"
+    )
     args = parser.parse_args()
     
-    abbreviate_file(args.input_file, args.depth, args.preserve_chars, args.preserve_lines, args.debug)
\ No newline at end of file
+    abbreviate_files(
+        args.input_files, args.depth, args.preserve_chars, args.preserve_lines, args.debug, args.workers, args.fast
+    )
\ No newline at end of file
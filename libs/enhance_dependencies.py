@@ -8,10 +8,118 @@ and adds the summary to the module's information.
 """
 
 import json
+import logging
 import os
 import sys
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Tuple
+
+from file_tools import iter_files
+
+# ijson is optional; without it the dependencies file is parsed in one go
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson is optional; stdlib json is used when it's missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+def _read_summary(summary_file: str) -> str:
+    """
+    Read a summary file.
+    
+    Args:
+        summary_file: Path to the summary file
+    
+    Returns:
+        The summary, stripped of surrounding whitespace
+    """
+    with open(summary_file, 'r') as f:
+        return f.read().strip()
+
+def _canon(name: str) -> str:
+    """
+    Normalize a module name or relative module path to a dotted module name.
+    
+    Args:
+        name: Module name like "handlers.start" or path like "handlers/start.py"
+    
+    Returns:
+        The dotted module name, e.g. "handlers.start"
+    """
+    return name.removesuffix(".py").replace("/", ".").replace("\\", ".")
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize an object as JSON indented by two spaces, using orjson when it's installed.
+    
+    Args:
+        obj: The object to serialize
+    
+    Returns:
+        The UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+def _iter_dependencies(f: BinaryIO) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield the modules of a dependencies JSON file one at a time.
+    
+    Args:
+        f: The dependencies file, opened in binary mode
+    
+    Yields:
+        Tuples of (module name, module info)
+    """
+    if ijson is None:
+        yield from (orjson.loads(f.read()) if orjson is not None else json.load(f)).items()
+    else:
+        yield from ijson.kvitems(f, "", use_float=True)
+
+def _find_summary(module_name, module_info, module_summaries, base_summaries):
+    """
+    Find the summary for a module in the dependencies.
+    
+    Args:
+        module_name: Name of the module in the dependencies
+        module_info: The module's information from the dependencies
+        module_summaries: Summaries keyed by canonical module name
+        base_summaries: Summaries keyed by the last module name component
+    
+    Returns:
+        The summary, or None if there isn't one
+    """
+    # Try the module name, its recorded name and its file name in turn; each
+    # candidate is only canonicalized if the ones before it missed
+    path = module_info.get("path")
+    candidates = (
+        (module_name, ""),
+        (module_info.get("name"), " (using name)"),
+        (path.rpartition("/")[2] if path else None, " (using path basename)"),
+    )
+    for key, note in candidates:
+        if key:
+            summary = module_summaries.get(_canon(key))
+            if summary is not None:
+                log.debug("Enhanced %s with summary%s", module_name, note)
+                return summary
+    
+    summary = base_summaries.get(module_name.rpartition(".")[2])
+    if summary is None:
+        log.debug("No summary found for %s", module_name)
+    else:
+        log.debug("Enhanced %s with summary (using base name)", module_name)
+    return summary
+
 
 def enhance_dependencies(deps_file, summaries_dir, output_file):
     """
@@ -24,85 +132,59 @@ def enhance_dependencies(deps_file, summaries_dir, output_file):
     """
     print(f"Enhancing dependencies from {deps_file} with summaries from {summaries_dir}")
     
-    # Read the dependencies JSON
-    with open(deps_file, 'r') as f:
-        dependencies = json.load(f)
-    
-    # Dictionary to store module summaries
+    # Summaries keyed by canonical module name, plus the last name component
+    # so modules can still be matched by their base name
     module_summaries = {}
+    base_summaries = {}
     
     # Find all summary files
-    summary_files = glob.glob(os.path.join(summaries_dir, "**/*.summary.txt"), recursive=True)
+    summary_files = list(iter_files(summaries_dir, ".summary.txt"))
     print(f"Found {len(summary_files)} summary files")
     
+    # Read the summaries on a thread pool so the reads overlap; threads
+    # release the GIL while blocked on I/O
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        contents = list(executor.map(_read_summary, summary_files))
+    
+    # Paths from iter_files all start with the summaries directory, so the
+    # relative path is a slice rather than an os.path.relpath normalization
+    prefix_len = len(os.path.join(summaries_dir, ""))
+    
     # Process each summary file
-    for summary_file in summary_files:
-        # Read the summary content
-        with open(summary_file, 'r') as f:
-            summary_content = f.read().strip()
-        
-        # Extract the relative path from the summary file
-        rel_path = os.path.relpath(summary_file, summaries_dir)
-        
-        # Extract the module name from the summary file path
-        # Remove the .summary.txt suffix
-        module_path = rel_path.replace(".summary.txt", "")
+    for summary_file, summary_content in zip(summary_files, contents):
+        # Derive the module name from the relative path, without the
+        # .summary.txt suffix
+        module_name = _canon(summary_file[prefix_len:].removesuffix(".summary.txt"))
         
-        # Handle different possible module name formats
-        if module_path == "bot.py":
-            # Special case for bot.py at root level
-            module_name = "bot.py"
-        elif module_path.startswith("handlers/"):
-            # Convert handlers/some_module.py to handlers.some_module
-            parts = module_path.split("/")
-            base_name = os.path.splitext(parts[1])[0]  # Remove .py extension
-            module_name = f"handlers.{base_name}"
-        else:
-            # Fallback case - replace / with . and remove .py extension
-            module_name = os.path.splitext(module_path)[0].replace("/", ".")
-        
-        # Store the summary with various possible module name formats to maximize matching chances
         module_summaries[module_name] = summary_content
-        module_summaries[module_path] = summary_content
-        
-        # Also store with just the base name (without extension)
-        base_name = os.path.splitext(os.path.basename(module_path))[0]
-        module_summaries[base_name] = summary_content
+        base_summaries[module_name.rsplit(".", 1)[-1]] = summary_content
         
-        print(f"Loaded summary for {module_name}")
+        log.debug("Loaded summary for %s", module_name)
     
-    # Enhance each module in the dependencies
+    # Enhance each module while streaming it from the dependencies file to a
+    # temporary output file, in the layout json.dump(..., indent=2) produces
     enhanced_count = 0
-    for module_name, module_info in dependencies.items():
-        # Try multiple matching strategies to find a summary
-        if module_name in module_summaries:
-            module_info["summary"] = module_summaries[module_name]
-            enhanced_count += 1
-            print(f"Enhanced {module_name} with summary")
-        elif "name" in module_info and module_info["name"] in module_summaries:
-            module_info["summary"] = module_summaries[module_info["name"]]
-            enhanced_count += 1
-            print(f"Enhanced {module_name} with summary (using name)")
-        elif "path" in module_info and module_info["path"] and os.path.basename(module_info["path"]) in module_summaries:
-            module_info["summary"] = module_summaries[os.path.basename(module_info["path"])]
-            enhanced_count += 1
-            print(f"Enhanced {module_name} with summary (using path basename)")
-        else:
-            # Try to match by converting module name to various formats
-            base_name = module_name.split(".")[-1]
-            if base_name in module_summaries:
-                module_info["summary"] = module_summaries[base_name]
+    tmp_file = f"{output_file}.tmp"
+    # A large write buffer turns the many small per-module writes into few syscalls
+    with open(deps_file, 'rb') as src, open(tmp_file, 'wb', buffering=1 << 20) as out:
+        separator = b"{\n"
+        for module_name, module_info in _iter_dependencies(src):
+            summary = _find_summary(module_name, module_info, module_summaries, base_summaries)
+            if summary is not None:
+                module_info["summary"] = summary
                 enhanced_count += 1
-                print(f"Enhanced {module_name} with summary (using base name)")
-            else:
-                print(f"No summary found for {module_name}")
+            
+            out.write(separator)
+            out.write(b"  " + _dumps(module_name) + b": ")
+            out.write(_dumps(module_info).replace(b"\n", b"\n  "))
+            separator = b",\n"
+        out.write(b"{}" if separator == b"{\n" else b"\n}")
     
-    print(f"Enhanced {enhanced_count} module(s) with summaries")
-    
-    # Save the enhanced dependencies
-    with open(output_file, 'w') as f:
-        json.dump(dependencies, f, indent=2)
+    # Replace the output only once it's complete, which also allows
+    # writing over the input file
+    os.replace(tmp_file, output_file)
     
+    print(f"Enhanced {enhanced_count} module(s) with summaries")
     print(f"Enhanced dependencies saved to {output_file}")
 
 
@@ -0,0 +1,58 @@
+"""
+File Tools Module
+
+This module provides the file system helpers shared by the app and the libs modules.
+"""
+
+import functools
+import hashlib
+import importlib.util
+import os
+from typing import Iterator
+
+
+def iter_files(root: str, suffix: str) -> Iterator[str]:
+    """
+    Yield paths of files under a directory whose names end with a suffix.
+    
+    Walks with os.scandir and an explicit stack, so directory checks use the
+    cached entry type instead of extra stat calls. Hidden files and directories
+    are skipped, matching a recursive glob.
+    
+    Args:
+        root: Directory to search
+        suffix: File name suffix to match
+    
+    Yields:
+        Paths of matching files
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Missing or unreadable directories are skipped, as glob does
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    yield entry.path
+
+
+@functools.lru_cache(maxsize=None)
+def abbreviator_version() -> str:
+    """
+    Get the version of libs/abbreviator.py that cached abbreviations and summaries are tied to.
+    
+    The module is located without importing it, and hashing its source means
+    any edit to the abbreviator retires results made with the old one.
+    
+    Returns:
+        BLAKE2b hex digest of the abbreviator source
+    """
+    with open(importlib.util.find_spec("abbreviator").origin, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
@@ -27,4 +27,79 @@ Provide a one-paragraph summary of the following snippet from the above code. Th
 {snippet}
 </CODE_TO_SUMMARIZE>
 
-Now, summarize the above script into a single paragraph. If you cannot summarize it for some reason, make sure you respond with the string [_INDETERMINATE_] including the underscores and square brackets. The summary should be no more than five sentences."""
\ No newline at end of file
+Now, summarize the above script into a single paragraph. If you cannot summarize it for some reason, make sure you respond with the string [_INDETERMINATE_] including the underscores and square brackets. The summary should be no more than five sentences."""
+
+def _split_template(template, field):
+    """
+    Split a template around its only placeholder, so filling it in is a plain concatenation.
+    
+    Args:
+        template: The template string
+        field: Name of the placeholder
+        
+    Returns:
+        Tuple of (text before the placeholder, text after it)
+    """
+    before, placeholder, after = template.partition("{" + field + "}")
+    if not placeholder or placeholder in after:
+        raise ValueError(f"{{{field}}} must appear exactly once in the template")
+    return before, after
+
+
+def _split_fields(template, fields):
+    """
+    Split a template into the literal text around each of its placeholders.
+    
+    Args:
+        template: The template string
+        fields: Names of the placeholders, in the order they appear
+        
+    Returns:
+        Tuple with one more piece of literal text than there are fields
+    """
+    pieces = []
+    rest = template
+    for field in fields:
+        before, rest = _split_template(rest, field)
+        pieces.append(before)
+    pieces.append(rest)
+    return tuple(pieces)
+
+
+# Templates pre-split at import, so each prompt is built by joining fragments
+# instead of str.format parsing the template on every call
+_ABBREVIATED_SCRIPT_PRE, _ABBREVIATED_SCRIPT_POST = _split_template(ABBREVIATED_SCRIPT, "script")
+_SNIPPET_FIELDS = ("dependencies", "preceding_context", "following_context", "snippet")
+_SNIPPET_PIECES = _split_fields(SNIPPET_WITH_ABBREVIATED_CONTEXT, _SNIPPET_FIELDS)
+
+
+def format_abbreviated_script(script):
+    """
+    Fill in ABBREVIATED_SCRIPT, equivalent to ABBREVIATED_SCRIPT.format(script=script).
+    
+    Args:
+        script: The content of the script to summarize
+        
+    Returns:
+        The prompt
+    """
+    return "".join((_ABBREVIATED_SCRIPT_PRE, script, _ABBREVIATED_SCRIPT_POST))
+
+
+def format_snippet_with_abbreviated_context(dependencies, preceding_context, following_context, snippet):
+    """
+    Fill in SNIPPET_WITH_ABBREVIATED_CONTEXT, equivalent to calling its format method.
+    
+    Args:
+        dependencies: Dependencies related to the code
+        preceding_context: Code that comes before the snippet
+        following_context: Code that comes after the snippet
+        snippet: The code snippet to summarize
+        
+    Returns:
+        The prompt
+    """
+    p = _SNIPPET_PIECES
+    return "".join((
+        p[0], dependencies, p[1], preceding_context, p[2], following_context, p[3], snippet, p[4]
+    ))
@@ -5,15 +5,52 @@ This module provides functions to analyze and visualize Python module dependenci
 using the pydeps package.
 """
 
+import copy
 import subprocess
 import json
 import os
-from typing import Dict, Any, Optional
+import sys
+import sysconfig
+from typing import Dict, Any, Optional, Tuple
+
+# orjson is optional; stdlib json is used when it's missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Standard library directories, and the site-packages directories that may sit inside them
+_STDLIB_DIRS = tuple({os.path.join(sysconfig.get_paths()[key], "") for key in ("stdlib", "platstdlib")})
+_SITE_DIRS = tuple({os.path.join(sysconfig.get_paths()[key], "") for key in ("purelib", "platlib")})
+
+# Successful pydeps results keyed by (absolute path, include_pylib, mtime, script path), oldest first
+_PYDEPS_CACHE_SIZE = 64
+_pydeps_results: Dict[Tuple[str, bool, Optional[float], str], Dict[str, Any]] = {}
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object as JSON indented by two spaces, using orjson when it's installed.
+    
+    Args:
+        obj: The object to serialize
+    
+    Returns:
+        The UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
 
 
 def run_pydeps(script_path: str, include_pylib: bool = False) -> Optional[Dict[str, Any]]:
     """Run pydeps on the given script and return parsed JSON output.
     
+    Successful results are cached on the script's absolute path and
+    modification time, so analyzing an unchanged script again doesn't start
+    another pydeps process. Only the script's own mtime is checked: edits to
+    modules it imports aren't seen until the script changes or the process
+    restarts. Failed runs aren't cached and are retried on the next call.
+    
     Args:
         script_path: Path to the Python script to analyze
         include_pylib: Whether to include Python standard library modules
@@ -21,6 +58,36 @@ def run_pydeps(script_path: str, include_pylib: bool = False) -> Optional[Dict[s
     Returns:
         Dictionary of dependencies or None if error occurred
     """
+    abs_path = os.path.abspath(script_path)
+    try:
+        mtime = os.path.getmtime(abs_path)
+    except OSError:
+        mtime = None
+    
+    key = (abs_path, include_pylib, mtime, script_path)
+    result = _pydeps_results.get(key)
+    if result is None:
+        result, ok = _run_pydeps(script_path, include_pylib)
+        if not ok:
+            return result
+        if len(_pydeps_results) >= _PYDEPS_CACHE_SIZE:
+            del _pydeps_results[next(iter(_pydeps_results))]
+        _pydeps_results[key] = result
+    
+    # Callers modify the result (see make_paths_relative), so hand out copies
+    return copy.deepcopy(result)
+
+
+def _run_pydeps(script_path: str, include_pylib: bool) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """Start a pydeps process for run_pydeps.
+    
+    Args:
+        script_path: Path to the script as given to run_pydeps
+        include_pylib: Whether to include Python standard library modules
+    
+    Returns:
+        Tuple of (dependencies or None if error occurred, whether pydeps succeeded)
+    """
     # Check if we're in a virtual environment and use its pydeps
     venv_pydeps = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "venv", "bin", "pydeps")
     if os.path.exists(venv_pydeps):
@@ -46,18 +113,60 @@ def run_pydeps(script_path: str, include_pylib: bool = False) -> Optional[Dict[s
             print(f"This may happen if the script has no analyzable imports or if dependencies are not installed.")
             # Return a minimal structure with just the script itself
             script_name = os.path.basename(script_path)
-            return {script_name: {"bacon": 0, "name": script_name, "path": script_path}}
+            return {script_name: {"bacon": 0, "name": script_name, "path": script_path}}, True
         
-        return json.loads(result.stdout)
+        # orjson's JSONDecodeError subclasses json's, so the handler below covers both
+        return (orjson.loads(result.stdout) if orjson is not None else json.loads(result.stdout)), True
     except subprocess.CalledProcessError as e:
         print(f"Error running pydeps: {e.stderr}")
         # Try to provide a minimal response even on error
         script_name = os.path.basename(script_path)
-        return {script_name: {"bacon": 0, "name": script_name, "path": script_path, "error": str(e)}}
+        return {script_name: {"bacon": 0, "name": script_name, "path": script_path, "error": str(e)}}, False
     except json.JSONDecodeError as e:
         print(f"Error parsing JSON output from pydeps: {e}")
         print(f"Output was: {result.stdout[:500]}")  # Show first 500 chars for debugging
-        return None
+        return None, False
+
+
+def _is_stdlib(name: str, path: Optional[str]) -> bool:
+    """Check whether a module is in the standard library rather than site-packages.
+    
+    Args:
+        name: Module name from pydeps
+        path: Module path from pydeps, which is None for built-in modules
+    
+    Returns:
+        True if the module is built in or under the standard library directories
+    """
+    if not path:
+        return name in sys.builtin_module_names
+    return path.startswith(_STDLIB_DIRS) and not path.startswith(_SITE_DIRS)
+
+
+def without_stdlib(dependencies: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop standard library modules from dependencies found with include_pylib.
+    
+    This gives the same modules as running pydeps without --pylib, so one
+    pydeps run can produce both views.
+    
+    Args:
+        dependencies: Dictionary of dependencies from run_pydeps
+    
+    Returns:
+        Dictionary of the dependencies outside the standard library. Entries
+        are copies whose imports and imported_by only name kept modules.
+    """
+    kept = {name for name, dep in dependencies.items() if not _is_stdlib(name, dep.get("path"))}
+    result = {}
+    for name, dep in dependencies.items():
+        if name not in kept:
+            continue
+        dep = dict(dep)
+        for field in ("imports", "imported_by"):
+            if field in dep:
+                dep[field] = [other for other in dep[field] if other in kept]
+        result[name] = dep
+    return result
 
 
 def make_paths_relative(dependencies: Dict[str, Any], base_dir: str) -> Dict[str, Any]:
@@ -70,10 +179,13 @@ def make_paths_relative(dependencies: Dict[str, Any], base_dir: str) -> Dict[str
     Returns:
         Modified dependencies dictionary with relative paths
     """
+    # Paths under the directory share this prefix, so the relative path is what follows it
+    base = os.path.join(os.path.abspath(base_dir), "")
+    base_len = len(base)
     for dep in dependencies.values():
-        if "path" in dep and dep["path"]:
-            if dep["path"].startswith(base_dir):
-                dep["path"] = os.path.relpath(dep["path"], base_dir)
+        path = dep.get("path")
+        if path and path.startswith(base):
+            dep["path"] = path[base_len:]
     return dependencies
 
 
@@ -87,11 +199,22 @@ def save_dependencies(script_path: str, output_file: str, include_pylib: bool =
     """
     dependencies = run_pydeps(script_path, include_pylib)
     if dependencies:
-        script_dir = os.path.dirname(os.path.abspath(script_path))
-        dependencies = make_paths_relative(dependencies, script_dir)
-        with open(output_file, "w") as f:
-            json.dump(dependencies, f, indent=2)
-        print(f"Dependencies written to {output_file}")
+        write_dependencies(dependencies, script_path, output_file)
+
+
+def write_dependencies(dependencies: Dict[str, Any], script_path: str, output_file: str) -> None:
+    """Make dependency paths relative to the script's directory and save them as JSON.
+    
+    Args:
+        dependencies: Dictionary of dependencies from run_pydeps, modified in place
+        script_path: Path to the analyzed script
+        output_file: Path to save the JSON output
+    """
+    script_dir = os.path.dirname(os.path.abspath(script_path))
+    dependencies = make_paths_relative(dependencies, script_dir)
+    with open(output_file, "wb") as f:
+        f.write(_dumps(dependencies))
+    print(f"Dependencies written to {output_file}")
 
 
 def ensure_telegram_bot(repo_path: str = "./data/repos/telegram_bot") -> None:
@@ -103,8 +226,13 @@ def ensure_telegram_bot(repo_path: str = "./data/repos/telegram_bot") -> None:
     if not os.path.exists(repo_path):
         # Create directory structure if it doesn't exist
         os.makedirs(os.path.dirname(repo_path), exist_ok=True)
-        # Clone the repository to the specified location
-        subprocess.run(["git", "clone", "https://github.com/calhounpaul/telegram_bot", repo_path])
+        # Clone only the latest commit, which is all the analysis needs; fail
+        # loudly rather than analyzing a missing or partial checkout
+        subprocess.run(
+            ["git", "clone", "--depth=1", "--filter=blob:none", "--single-branch",
+             "https://github.com/calhounpaul/telegram_bot", repo_path],
+            check=True
+        )
 
 
 def analyze_project(script_path: str = "./data/repos/telegram_bot/bot.py") -> None:
@@ -123,9 +251,13 @@ def analyze_project(script_path: str = "./data/repos/telegram_bot/bot.py") -> No
     # Create output directory if it doesn't exist
     os.makedirs(os.path.join("data", "output"), exist_ok=True)
     
-    # Save dependencies 
-    save_dependencies(script_path, os.path.join("data", "output", "deps_min.json"))
-    save_dependencies(script_path, os.path.join("data", "output", "deps_all.json"), include_pylib=True)
+    # Run pydeps once with the standard library and derive the version
+    # without it, rather than analyzing the project twice
+    deps_all = run_pydeps(script_path, include_pylib=True)
+    if deps_all:
+        deps_min = without_stdlib(deps_all)
+        write_dependencies(deps_min, script_path, os.path.join("data", "output", "deps_min.json"))
+        write_dependencies(deps_all, script_path, os.path.join("data", "output", "deps_all.json"))
 
 
 if __name__ == "__main__":
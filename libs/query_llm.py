@@ -1,8 +1,11 @@
 import os
+import asyncio
+import functools
+import hashlib
+import json
 import logging
-import glob
 import time
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from typing import List, Dict, Union, Optional, Tuple
 import prompts.summarize_templates
 import sys
@@ -12,6 +15,186 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "libs"))
 
 # Import modules from libs directory
 from abbreviator import abbreviate_code
+from file_tools import abbreviator_version, iter_files
+
+log = logging.getLogger(__name__)
+
+# Summaries already produced for an input, keyed by a hash of everything sent to the LLM
+DEFAULT_SUMMARY_CACHE_DIR = os.path.join("data", "output", "summaries", ".cache")
+
+# Record of which unchanged scripts already have summaries, kept in the output directory
+_MANIFEST_NAME = ".manifest.json"
+
+# Changing a prompt invalidates the manifest and the cached summaries made with it
+_TEMPLATE_HASH = hashlib.sha256(prompts.summarize_templates.ABBREVIATED_SCRIPT.encode("utf-8")).hexdigest()[:16]
+_SNIPPET_TEMPLATE_HASH = hashlib.sha256(
+    prompts.summarize_templates.SNIPPET_WITH_ABBREVIATED_CONTEXT.encode("utf-8")
+).hexdigest()[:16]
+
+# Async clients keyed by (api_base, token_file), so requests share a connection pool
+_async_clients: Dict[Tuple[str, str], AsyncOpenAI] = {}
+
+def _read_api_key(token_file: str) -> str:
+    """
+    Read the API token from a file.
+    
+    Args:
+        token_file: File containing the API token
+    
+    Returns:
+        The API token
+    """
+    try:
+        with open(token_file, "r") as f:
+            return f.read().strip()
+    except Exception as e:
+        log.error("Error reading token file %s: %s", token_file, e)
+        raise
+
+@functools.lru_cache(maxsize=8)
+def _client(api_base: str, token_file: str) -> OpenAI:
+    """
+    Get the shared client for an API base and token file, so calls reuse its connection pool.
+    
+    Args:
+        api_base: Base URL for the API
+        token_file: File containing the API token
+        
+    Returns:
+        The OpenAI client
+    """
+    return OpenAI(base_url=api_base, api_key=_read_api_key(token_file))
+
+def _load_manifest(manifest_file: str, settings: Dict[str, object]) -> Dict[str, List[int]]:
+    """
+    Read the summary manifest, if it was written with the same settings.
+    
+    Args:
+        manifest_file: Path to the manifest
+        settings: Model, template hash, abbreviator version and abbreviation settings of this run
+    
+    Returns:
+        Dictionary mapping script paths to their [st_mtime_ns, st_size] when summarized
+    """
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("settings") != settings:
+        return {}
+    return manifest.get("files", {})
+
+def _save_manifest(manifest_file: str, settings: Dict[str, object], files: Dict[str, List[int]]) -> None:
+    """
+    Write the summary manifest atomically.
+    
+    Args:
+        manifest_file: Path to the manifest
+        settings: Model, template hash, abbreviator version and abbreviation settings of this run
+        files: Dictionary mapping script paths to their [st_mtime_ns, st_size] when summarized
+    """
+    tmp_file = f"{manifest_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump({"settings": settings, "files": files}, f)
+    os.replace(tmp_file, manifest_file)
+
+def _summary_file_path(py_file: str, repo_path: str, output_dir: str) -> str:
+    """
+    Get where the summary of a script is saved.
+    
+    Args:
+        py_file: Path to the script
+        repo_path: Path to the repository the script belongs to
+        output_dir: Directory to save the summaries
+    
+    Returns:
+        Path of the summary file
+    """
+    return os.path.join(output_dir, f"{os.path.relpath(py_file, repo_path)}.summary.txt")
+
+def _get_async_client(api_base: str, token_file: str) -> AsyncOpenAI:
+    """
+    Get the shared async client for an API base and token file, creating it on first use.
+    
+    Args:
+        api_base: Base URL for the API
+        token_file: File containing the API token
+    
+    Returns:
+        The async OpenAI client
+    """
+    key = (api_base, token_file)
+    client = _async_clients.get(key)
+    if client is None:
+        client = _async_clients[key] = AsyncOpenAI(base_url=api_base, api_key=_read_api_key(token_file))
+    return client
+
+async def _close_async_clients() -> None:
+    """Close the shared async clients, which belong to the running event loop."""
+    clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in clients:
+        await client.close()
+
+def _summary_hash(*parts: str) -> str:
+    """
+    Hash the inputs that determine a summary.
+    
+    Args:
+        parts: The model name, prompt template hash, prompt inputs and code that go into the request
+    
+    Returns:
+        Hex digest identifying the summary
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def _summary_cache_path(content_hash: str, cache_dir: str = DEFAULT_SUMMARY_CACHE_DIR) -> str:
+    """
+    Get the cache file for a summary.
+    
+    Args:
+        content_hash: Hash from _summary_hash
+        cache_dir: Directory holding cached summaries
+    
+    Returns:
+        Path of the cache file
+    """
+    return os.path.join(cache_dir, f"{content_hash}.txt")
+
+def _load_cached_summary(cache_file: str) -> Optional[str]:
+    """
+    Read a cached summary.
+    
+    Args:
+        cache_file: Path from _summary_cache_path
+    
+    Returns:
+        The cached summary, or None if there isn't one
+    """
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def _save_cached_summary(cache_file: str, summary: str) -> None:
+    """
+    Write a summary to the cache, replacing the file atomically so readers never see a partial one.
+    
+    Args:
+        cache_file: Path from _summary_cache_path
+        summary: The summary to cache
+    """
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write(summary)
+    os.replace(tmp_file, cache_file)
 
 def get_llm_response(
     messages: List[Dict[str, str]],
@@ -41,16 +224,8 @@ def get_llm_response(
         If stream=False: The text response from the LLM
         If stream=True: The streaming response object
     """
-    # Read the API token
-    try:
-        with open(token_file, "r") as f:
-            api_key = f.read().strip()
-    except Exception as e:
-        logging.error(f"Error reading token file {token_file}: {e}")
-        raise
-    
-    # Initialize the client
-    client = OpenAI(base_url=api_base, api_key=api_key)
+    # Reuse the client, and the token read with it, across calls
+    client = _client(api_base, token_file)
     
     try:
         # Create a chat completion
@@ -71,9 +246,70 @@ def get_llm_response(
             return response.choices[0].message.content
             
     except Exception as e:
-        logging.error(f"Error getting LLM response: {e}")
+        log.error("Error getting LLM response: %s", e)
+        raise
+
+async def aget_llm_response(
+    messages: List[Dict[str, str]],
+    model_name: str = "deepseek-ai/DeepSeek-V3",
+    api_base: str = "https://api.hyperbolic.xyz/v1/",
+    max_tokens: int = 2048,
+    temperature: float = 0.7,
+    top_p: float = 0.95,
+    stream: bool = False,
+    token_file: str = "secrets/hyperbolic_api_key.txt"
+) -> Union[str, object]:
+    """
+    Send a formatted conversation to an LLM and get the response, without blocking the event loop.
+    
+    Args:
+        messages: List of message dictionaries with 'role' and 'content' keys
+        model_name: Name of the model to use (default: DeepSeek-V3)
+        api_base: Base URL for the API
+        max_tokens: Maximum tokens in the response
+        temperature: Sampling temperature (0.0 to 1.0)
+        top_p: Nucleus sampling parameter
+        stream: Whether to stream the response
+        token_file: File containing the API token
+    
+    Returns:
+        If stream=False: The text response from the LLM
+        If stream=True: The async streaming response object
+    """
+    client = _get_async_client(api_base, token_file)
+    
+    try:
+        # Create a chat completion
+        response = await client.chat.completions.create(
+            model=model_name,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            stream=stream
+        )
+        
+        if stream:
+            # Return the stream object for the caller to iterate
+            return response
+        return response.choices[0].message.content
+    
+    except Exception as e:
+        log.error("Error getting LLM response: %s", e)
         raise
 
+def _script_messages(script: str) -> List[Dict[str, str]]:
+    """
+    Build the conversation asking for a summary of a script.
+    
+    Args:
+        script: The content of the script to summarize
+    
+    Returns:
+        List of message dictionaries for the LLM
+    """
+    return [{"role": "user", "content": prompts.summarize_templates.format_abbreviated_script(script)}]
+
 def summarize_script(
     script: str,
     model_name: str = "deepseek-ai/DeepSeek-V3",
@@ -90,11 +326,109 @@ def summarize_script(
         A summary of the script
     """
     return get_llm_response(
-        messages=[{"role": "user", "content": prompts.summarize_templates.ABBREVIATED_SCRIPT.format(script=script)}],
+        messages=_script_messages(script),
         model_name=model_name,
         api_base=api_base
     )
 
+async def asummarize_script(
+    script: str,
+    model_name: str = "deepseek-ai/DeepSeek-V3",
+    api_base: str = "https://api.hyperbolic.xyz/v1/",):
+    """
+    Summarize a complete script using an LLM, without blocking the event loop.
+    
+    Args:
+        script: The content of the script to summarize
+        model_name: Name of the model to use
+        api_base: Base URL for the API
+    
+    Returns:
+        A summary of the script
+    """
+    return await aget_llm_response(
+        messages=_script_messages(script),
+        model_name=model_name,
+        api_base=api_base
+    )
+
+def summarize_script_streaming(
+    script: str,
+    summary_file: str,
+    model_name: str = "deepseek-ai/DeepSeek-V3",
+    api_base: str = "https://api.hyperbolic.xyz/v1/",
+) -> str:
+    """
+    Summarize a complete script using an LLM, writing the summary to a file as it streams in.
+    
+    The file is written under a temporary name and moved into place once the
+    response is complete, so an interrupted summary is never left behind.
+    
+    Args:
+        script: The content of the script to summarize
+        summary_file: Path to save the summary
+        model_name: Name of the model to use
+        api_base: Base URL for the API
+    
+    Returns:
+        A summary of the script
+    """
+    stream = get_llm_response(messages=_script_messages(script), model_name=model_name, api_base=api_base, stream=True)
+    parts = []
+    tmp_file = f"{summary_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    f.write(delta)
+                    parts.append(delta)
+        os.replace(tmp_file, summary_file)
+    except BaseException:
+        # A failed or cancelled stream leaves no partial file behind
+        if os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+        raise
+    return "".join(parts)
+
+async def asummarize_script_streaming(
+    script: str,
+    summary_file: str,
+    model_name: str = "deepseek-ai/DeepSeek-V3",
+    api_base: str = "https://api.hyperbolic.xyz/v1/",
+) -> str:
+    """
+    Summarize a script like summarize_script_streaming, without blocking the event loop.
+    
+    Other requests are serviced while this response arrives token by token.
+    
+    Args:
+        script: The content of the script to summarize
+        summary_file: Path to save the summary
+        model_name: Name of the model to use
+        api_base: Base URL for the API
+    
+    Returns:
+        A summary of the script
+    """
+    stream = await aget_llm_response(messages=_script_messages(script), model_name=model_name, api_base=api_base, stream=True)
+    parts = []
+    tmp_file = f"{summary_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    f.write(delta)
+                    parts.append(delta)
+        os.replace(tmp_file, summary_file)
+    except BaseException:
+        # A failed or cancelled stream leaves no partial file behind
+        if os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+        raise
+    return "".join(parts)
+
 def summarize_code(
     dependencies: str,
     preceding_context: str,
@@ -102,6 +436,8 @@ def summarize_code(
     snippet: str,
     model_name: str = "deepseek-ai/DeepSeek-V3",
     api_base: str = "https://api.hyperbolic.xyz/v1/",
+    cache_dir: Optional[str] = DEFAULT_SUMMARY_CACHE_DIR,
+    force_refresh: bool = False,
 ):
     """
     Summarize a code snippet with context using an LLM.
@@ -113,20 +449,225 @@ def summarize_code(
         snippet: The code snippet to summarize
         model_name: Name of the model to use
         api_base: Base URL for the API
+        cache_dir: Directory for cached summaries, or None to disable caching
+        force_refresh: Whether to ask the LLM again even if a cached summary exists
         
     Returns:
         A summary of the code snippet
     """
-    return get_llm_response(
-        messages=[{"role": "user", "content": prompts.summarize_templates.SNIPPET_WITH_ABBREVIATED_CONTEXT.format(
-            dependencies=dependencies,
-            preceding_context=preceding_context,
-            following_context=following_context,
-            snippet=snippet
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = _summary_cache_path(
+            _summary_hash(
+                model_name, _SNIPPET_TEMPLATE_HASH, dependencies, preceding_context, following_context, snippet
+            ),
+            cache_dir
+        )
+        if not force_refresh:
+            cached = _load_cached_summary(cache_file)
+            if cached is not None:
+                return cached
+    
+    summary = get_llm_response(
+        messages=[{"role": "user", "content": prompts.summarize_templates.format_snippet_with_abbreviated_context(
+            dependencies,
+            preceding_context,
+            following_context,
+            snippet
         )}],
         model_name=model_name,
         api_base=api_base,
     )
+    
+    if cache_file is not None:
+        _save_cached_summary(cache_file, summary)
+    return summary
+
+async def _summarize_file(
+    py_file: str,
+    semaphore: asyncio.Semaphore,
+    repo_path: str,
+    depth: int,
+    preserve_chars: int,
+    preserve_lines: int,
+    min_char_count: int,
+    output_dir: str,
+    abbrev_dir: str,
+    model_name: str,
+    api_base: str,
+    force_refresh: bool,
+) -> Optional[str]:
+    """
+    Abbreviate and summarize one script, saving both to disk.
+    
+    Args:
+        py_file: Path to the script
+        semaphore: Semaphore bounding the number of LLM requests in flight
+        repo_path: Path to the repository the script belongs to
+        depth: Maximum nesting depth to preserve when abbreviating
+        preserve_chars: Number of characters to preserve per line in abbreviation
+        preserve_lines: Number of lines to preserve in abbreviation
+        min_char_count: Minimum character count for a file to be summarized
+        output_dir: Directory to save the summary
+        abbrev_dir: Directory to save the abbreviated code
+        model_name: Name of the model to use
+        api_base: Base URL for the API
+        force_refresh: Whether to ask the LLM again even if a cached summary exists
+    
+    Returns:
+        The summary, or None if the script was skipped or failed
+    """
+    try:
+        # Read the file
+        with open(py_file, "r", encoding="utf-8") as f:
+            content = f.read()
+        
+        # Skip files that are too small
+        if len(content) <= min_char_count:
+            log.debug("Skipping %s - too small (%d chars)", py_file, len(content))
+            return None
+        
+        log.debug("Processing %s (%d chars)", py_file, len(content))
+        
+        # Abbreviate in a worker thread; LibCST work on the event loop would
+        # stall every streaming request in flight
+        abbreviated_code = await asyncio.to_thread(abbreviate_code, content, depth, preserve_chars, preserve_lines)
+        
+        # Save the abbreviated code to a file, following project conventions
+        base_name = os.path.basename(py_file)
+        name, ext = os.path.splitext(base_name)
+        timestamp = int(time.time())
+        abbreviated_file = os.path.join(abbrev_dir, f"{name}_depth{depth}_{timestamp}{ext}")
+        
+        with open(abbreviated_file, "w", encoding="utf-8") as f:
+            f.write(abbreviated_code)
+        
+        log.debug("Abbreviated code written to %s (%d chars)", abbreviated_file, len(abbreviated_code))
+        
+        summary_file = _summary_file_path(py_file, repo_path, output_dir)
+        
+        # Create subdirectories if needed
+        os.makedirs(os.path.dirname(summary_file), exist_ok=True)
+        
+        # Reuse the summary of identical abbreviated code from an earlier run
+        cache_file = _summary_cache_path(
+            _summary_hash(model_name, _TEMPLATE_HASH, abbreviator_version(), abbreviated_code),
+            os.path.join(output_dir, ".cache")
+        )
+        summary = None if force_refresh else _load_cached_summary(cache_file)
+        
+        if summary is not None:
+            log.debug("Using cached summary for %s", py_file)
+            with open(summary_file, "w", encoding="utf-8") as f:
+                f.write(summary)
+        else:
+            # Summarize the abbreviated code, waiting for a free request slot,
+            # and save the summary as it streams in
+            async with semaphore:
+                summary = await asummarize_script_streaming(abbreviated_code, summary_file, model_name, api_base)
+            _save_cached_summary(cache_file, summary)
+        
+        log.debug("Summary saved to %s", summary_file)
+        
+        return summary
+    
+    except Exception as e:
+        log.error("Error processing %s: %s", py_file, e)
+        return None
+
+async def _summarize_files(
+    py_files: List[str],
+    repo_path: str,
+    depth: int,
+    preserve_chars: int,
+    preserve_lines: int,
+    min_char_count: int,
+    output_dir: str,
+    abbrev_dir: str,
+    model_name: str,
+    api_base: str,
+    max_concurrency: int,
+    force_refresh: bool,
+) -> Dict[str, str]:
+    """
+    Summarize scripts concurrently, with at most max_concurrency LLM requests in flight.
+    
+    Args:
+        py_files: Paths of the scripts to summarize
+        repo_path: Path to the repository the scripts belong to
+        depth: Maximum nesting depth to preserve when abbreviating
+        preserve_chars: Number of characters to preserve per line in abbreviation
+        preserve_lines: Number of lines to preserve in abbreviation
+        min_char_count: Minimum character count for a file to be summarized
+        output_dir: Directory to save the summaries
+        abbrev_dir: Directory to save the abbreviated code
+        model_name: Name of the model to use
+        api_base: Base URL for the API
+        max_concurrency: Maximum number of LLM requests in flight at once
+        force_refresh: Whether to ask the LLM again even for cached summaries
+    
+    Returns:
+        A dictionary mapping file paths to their summaries
+    """
+    # Scripts whose size and modification time match the manifest, written
+    # with the same model, prompt, abbreviator and abbreviation settings, keep
+    # their saved summary without being read or abbreviated again
+    manifest_file = os.path.join(output_dir, _MANIFEST_NAME)
+    settings = {
+        "model": model_name,
+        "template_hash": _TEMPLATE_HASH,
+        "abbreviator": abbreviator_version(),
+        "abbreviation": [depth, preserve_chars, preserve_lines],
+    }
+    manifest = {} if force_refresh else _load_manifest(manifest_file, settings)
+    
+    stats: Dict[str, List[int]] = {}
+    found: Dict[str, str] = {}
+    pending: List[str] = []
+    for py_file in py_files:
+        try:
+            st = os.stat(py_file)
+        except OSError:
+            # _summarize_file reports the error
+            pending.append(py_file)
+            continue
+        
+        # A file has at least as many bytes as characters, so one this small
+        # would be skipped after reading it anyway
+        if st.st_size <= min_char_count:
+            log.debug("Skipping %s - too small (%d bytes)", py_file, st.st_size)
+            continue
+        
+        stats[py_file] = [st.st_mtime_ns, st.st_size]
+        if manifest.get(py_file) == stats[py_file]:
+            summary = _load_cached_summary(_summary_file_path(py_file, repo_path, output_dir))
+            if summary is not None:
+                found[py_file] = summary
+                continue
+        pending.append(py_file)
+    
+    if found:
+        print(f"Reusing summaries of {len(found)} unchanged files")
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    try:
+        results = await asyncio.gather(*[
+            _summarize_file(
+                py_file, semaphore, repo_path, depth, preserve_chars, preserve_lines,
+                min_char_count, output_dir, abbrev_dir, model_name, api_base, force_refresh
+            )
+            for py_file in pending
+        ])
+    finally:
+        await _close_async_clients()
+    
+    for py_file, summary in zip(pending, results):
+        if summary is not None:
+            found[py_file] = summary
+    
+    _save_manifest(manifest_file, settings, {py_file: stats[py_file] for py_file in found if py_file in stats})
+    
+    return {py_file: found[py_file] for py_file in py_files if py_file in found}
 
 def summarize_all_telegram_bot_scripts(
     repo_path: str = "data/repos/telegram_bot",
@@ -137,6 +678,8 @@ def summarize_all_telegram_bot_scripts(
     output_dir: str = "data/output/summaries",
     model_name: str = "deepseek-ai/DeepSeek-V3",
     api_base: str = "https://api.hyperbolic.xyz/v1/",
+    max_concurrency: int = 16,
+    force_refresh: bool = False,
 ):
     """
     Summarize all Python scripts in the telegram_bot repository, after first abbreviating them.
@@ -150,7 +693,9 @@ def summarize_all_telegram_bot_scripts(
         output_dir: Directory to save the summaries
         model_name: Name of the model to use
         api_base: Base URL for the API
-        
+        max_concurrency: Maximum number of LLM requests in flight at once
+        force_refresh: Whether to ask the LLM again even for cached summaries
+    
     Returns:
         A dictionary mapping file paths to their summaries
     """
@@ -162,7 +707,7 @@ def summarize_all_telegram_bot_scripts(
     os.makedirs(abbrev_dir, exist_ok=True)
     
     # Find all Python files in the repository
-    py_files = glob.glob(os.path.join(repo_path, "**/*.py"), recursive=True)
+    py_files = list(iter_files(repo_path, ".py"))
     
     if not py_files:
         print(f"No Python files found in {repo_path}")
@@ -170,55 +715,10 @@ def summarize_all_telegram_bot_scripts(
     
     print(f"Found {len(py_files)} Python files to process")
     
-    summaries = {}
-    
-    for py_file in py_files:
-        try:
-            # Read the file
-            with open(py_file, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            # Skip files that are too small
-            if len(content) <= min_char_count:
-                print(f"Skipping {py_file} - too small ({len(content)} chars)")
-                continue
-            
-            print(f"\nProcessing {py_file} ({len(content)} chars)")
-            
-            # Abbreviate the code to depth 2
-            abbreviated_code = abbreviate_code(content, depth, preserve_chars, preserve_lines)
-            
-            # Save the abbreviated code to a file, following project conventions
-            base_name = os.path.basename(py_file)
-            name, ext = os.path.splitext(base_name)
-            timestamp = int(time.time())
-            abbreviated_file = os.path.join(abbrev_dir, f"{name}_depth{depth}_{timestamp}{ext}")
-            
-            with open(abbreviated_file, "w", encoding="utf-8") as f:
-                f.write(abbreviated_code)
-            
-            print(f"Abbreviated code written to {abbreviated_file} ({len(abbreviated_code)} chars)")
-            
-            # Summarize the abbreviated code
-            summary = summarize_script(abbreviated_code, model_name, api_base)
-            
-            # Save the summary
-            relative_path = os.path.relpath(py_file, repo_path)
-            summary_file = os.path.join(output_dir, f"{relative_path}.summary.txt")
-            
-            # Create subdirectories if needed
-            os.makedirs(os.path.dirname(summary_file), exist_ok=True)
-            
-            with open(summary_file, "w", encoding="utf-8") as f:
-                f.write(summary)
-            
-            print(f"Summary saved to {summary_file}")
-            
-            # Store in results dictionary
-            summaries[py_file] = summary
-            
-        except Exception as e:
-            print(f"Error processing {py_file}: {e}")
+    summaries = asyncio.run(_summarize_files(
+        py_files, repo_path, depth, preserve_chars, preserve_lines, min_char_count,
+        output_dir, abbrev_dir, model_name, api_base, max_concurrency, force_refresh
+    ))
     
     return summaries
 
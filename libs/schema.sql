@@ -6,19 +6,21 @@ CREATE TABLE IF NOT EXISTS analysis_results (
     file_path TEXT NOT NULL,
     file_size INTEGER NOT NULL,
     file_md5 TEXT NOT NULL,
-    modified_date TEXT NOT NULL,
-    analysis_date TEXT NOT NULL,
+    modified_date INTEGER NOT NULL,  -- ms since the epoch
+    analysis_date INTEGER NOT NULL,  -- ms since the epoch
     analysis_type TEXT NOT NULL,
     parameters TEXT NOT NULL,  -- JSON string of parameters
     output_path TEXT NOT NULL,
     characters_saved INTEGER NOT NULL,
-    percent_saved REAL NOT NULL
+    percent_saved REAL NOT NULL,
+    cache_hit INTEGER NOT NULL DEFAULT 0  -- 1 if output came from data/cache
 );
 
 -- Index for faster queries
 CREATE INDEX IF NOT EXISTS idx_file_path ON analysis_results(file_path);
 CREATE INDEX IF NOT EXISTS idx_analysis_type ON analysis_results(analysis_type);
 CREATE INDEX IF NOT EXISTS idx_analysis_date ON analysis_results(analysis_date);
+CREATE INDEX IF NOT EXISTS idx_file_key ON analysis_results(file_md5, analysis_type);
 
 -- Table for storing file metadata history (for tracking changes over time)
 CREATE TABLE IF NOT EXISTS file_history (
@@ -38,6 +40,7 @@ SELECT
     SUM(characters_saved) as total_chars_saved,
     AVG(percent_saved) as avg_percent_saved,
     MAX(percent_saved) as max_percent_saved,
-    MIN(percent_saved) as min_percent_saved
+    MIN(percent_saved) as min_percent_saved,
+    SUM(cache_hit) as cache_hits
 FROM analysis_results
 GROUP BY analysis_type;
\ No newline at end of file
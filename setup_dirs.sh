@@ -20,6 +20,7 @@ fi
 mkdir -p data/output/dependencies
 mkdir -p data/output/abbreviations
 mkdir -p data/output/summaries
+mkdir -p data/cache/abbreviations
 mkdir -p data/db
 mkdir -p data/logs
 mkdir -p data/repos
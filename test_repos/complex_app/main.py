@@ -3,13 +3,17 @@
 
 import asyncio
 import logging
-import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Tuple
 from enum import Enum
 from contextlib import asynccontextmanager
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,7 +25,7 @@ class TaskStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Task data structure."""
     id: str
@@ -30,31 +34,39 @@ class Task:
     result: Optional[Any] = None
     error: Optional[str] = None
     dependencies: List[str] = field(default_factory=list)
+    unmet_deps: int = field(default=0, init=False)
     
     def __post_init__(self):
         """Post-initialization processing."""
         if not self.id:
             raise ValueError("Task ID cannot be empty")
+        self.unmet_deps = len(self.dependencies)
 
 class Observable:
     """Observer pattern implementation."""
     
     def __init__(self):
-        self._observers: List[Callable] = []
+        # Insertion-ordered keys give O(1) attach/detach, the tuples are what notify iterates
+        self._observers: Dict[str, Dict[Callable, None]] = {}
+        self._observers_by_event: Dict[str, Tuple[Callable, ...]] = {}
     
-    def attach(self, observer: Callable):
-        """Attach an observer."""
-        if observer not in self._observers:
-            self._observers.append(observer)
+    def attach(self, event: str, observer: Callable):
+        """Attach an observer to a single event."""
+        observers = self._observers.setdefault(event, {})
+        if observer not in observers:
+            observers[observer] = None
+            self._observers_by_event[event] = tuple(observers)
     
-    def detach(self, observer: Callable):
-        """Detach an observer."""
-        if observer in self._observers:
-            self._observers.remove(observer)
+    def detach(self, event: str, observer: Callable):
+        """Detach an observer from a single event."""
+        observers = self._observers.get(event)
+        if observers and observer in observers:
+            del observers[observer]
+            self._observers_by_event[event] = tuple(observers)
     
-    def notify(self, *args, **kwargs):
-        """Notify all observers."""
-        for observer in self._observers:
+    def notify(self, event: str, *args, **kwargs):
+        """Notify the observers of an event."""
+        for observer in self._observers_by_event.get(event, ()):
             try:
                 observer(*args, **kwargs)
             except Exception as e:
@@ -92,33 +104,48 @@ class TaskScheduler(Observable):
         super().__init__()
         self.max_concurrent_tasks = max_concurrent_tasks
         self.tasks: Dict[str, Task] = {}
-        self.running_tasks: Dict[str, asyncio.Task] = {}
         self.processor: Optional[TaskProcessor] = None
-        self._lock = threading.Lock()
+        # Reverse dependency edges, counted down through Task.unmet_deps
+        self._dependents: Dict[str, List[str]] = {}
+        self._ready: asyncio.Queue = asyncio.Queue()
+        self._active = 0
     
     def set_processor(self, processor: TaskProcessor):
         """Set the task processor."""
         self.processor = processor
     
     def add_task(self, task: Task):
-        """Add a task to the scheduler."""
-        with self._lock:
-            if task.id in self.tasks:
-                raise ValueError(f"Task {task.id} already exists")
-            self.tasks[task.id] = task
-            self.notify("task_added", task)
+        """Add a task to the scheduler.
+        
+        The scheduler is not thread-safe; call this from the event loop's thread.
+        """
+        if task.id in self.tasks:
+            raise ValueError(f"Task {task.id} already exists")
+        self.tasks[task.id] = task
+        for dep_id in task.dependencies:
+            self._dependents.setdefault(dep_id, []).append(task.id)
+            dep_task = self.tasks.get(dep_id)
+            if dep_task and dep_task.status == TaskStatus.COMPLETED:
+                task.unmet_deps -= 1
+        self.notify("task_added", task)
     
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
         return self.tasks.get(task_id)
     
-    def _check_dependencies(self, task: Task) -> bool:
-        """Check if all dependencies are completed."""
-        for dep_id in task.dependencies:
-            dep_task = self.tasks.get(dep_id)
-            if not dep_task or dep_task.status != TaskStatus.COMPLETED:
-                return False
-        return True
+    def _enqueue(self, task_id: str):
+        """Queue a task whose dependencies are all completed."""
+        self._active += 1
+        self._ready.put_nowait(task_id)
+    
+    def _release_dependents(self, task: Task):
+        """Count a completed task against its dependents and queue the ready ones."""
+        tasks = self.tasks
+        for dep_id in self._dependents.get(task.id, ()):
+            dependent = tasks[dep_id]
+            dependent.unmet_deps -= 1
+            if not dependent.unmet_deps:
+                self._enqueue(dep_id)
     
     async def _execute_task(self, task: Task):
         """Execute a single task."""
@@ -133,45 +160,49 @@ class TaskScheduler(Observable):
             task.result = result
             task.status = TaskStatus.COMPLETED
             self.notify("task_completed", task)
+            self._release_dependents(task)
             
         except Exception as e:
             task.error = str(e)
             task.status = TaskStatus.FAILED
             self.notify("task_failed", task)
             logger.error(f"Task {task.id} failed: {e}")
-        
+    
+    async def _run_task(self, task: Task, slots: asyncio.Semaphore):
+        """Execute a task and hand its concurrency slot back."""
+        try:
+            await self._execute_task(task)
         finally:
-            if task.id in self.running_tasks:
-                del self.running_tasks[task.id]
+            slots.release()
+            self._active -= 1
+            # Wake the dispatcher when nothing is queued or running anymore
+            if not self._active:
+                self._ready.put_nowait(None)
     
     async def run(self):
         """Run the task scheduler."""
         logger.info("Starting task scheduler")
         
-        while True:
-            # Find tasks ready to run
-            ready_tasks = [
-                task for task in self.tasks.values()
-                if (task.status == TaskStatus.PENDING and 
-                    self._check_dependencies(task) and
-                    task.id not in self.running_tasks)
-            ]
-            
-            # Start new tasks if we have capacity
-            available_slots = self.max_concurrent_tasks - len(self.running_tasks)
-            for task in ready_tasks[:available_slots]:
-                task_coroutine = asyncio.create_task(self._execute_task(task))
-                self.running_tasks[task.id] = task_coroutine
-            
-            # Check if all tasks are done
-            if not self.running_tasks and all(
-                task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]
-                for task in self.tasks.values()
-            ):
-                break
-            
-            # Wait a bit before checking again
-            await asyncio.sleep(0.1)
+        slots = asyncio.Semaphore(self.max_concurrent_tasks)
+        tasks = self.tasks
+        for task in tasks.values():
+            if not task.unmet_deps and task.status == TaskStatus.PENDING:
+                self._enqueue(task.id)
+        
+        # Tasks only enter the queue once their last dependency completes,
+        # and the task group waits for whatever is still running on exit
+        async with asyncio.TaskGroup() as group:
+            # Bound methods are looked up once rather than per dispatched task
+            next_ready = self._ready.get
+            acquire = slots.acquire
+            start = group.create_task
+            run_task = self._run_task
+            while self._active:
+                task_id = await next_ready()
+                if task_id is None:
+                    break
+                await acquire()
+                start(run_task(tasks[task_id], slots))
         
         logger.info("Task scheduler finished")
 
@@ -229,8 +260,9 @@ async def main():
     # Set up scheduler
     scheduler.set_processor(processor)
     
-    # Attach monitor to scheduler events
-    scheduler.attach(lambda event, task: getattr(monitor, f"on_{event}", lambda x: None)(task))
+    # Attach monitor handlers once per scheduler event
+    for event in ("task_added", "task_started", "task_completed", "task_failed"):
+        scheduler.attach(event, getattr(monitor, f"on_{event}"))
     
     # Create tasks with dependencies
     tasks = [
@@ -258,4 +290,8 @@ async def main():
         logger.info(f"  {task.id}: {task.status.value} - {task.result or task.error}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop's libuv-based loop is a drop-in, faster replacement where installed
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
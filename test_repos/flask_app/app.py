@@ -1,12 +1,36 @@
 #!/usr/bin/env python3
 """Simple Flask application for testing."""
 
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from sqlalchemy.orm import joinedload
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses with orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string, honouring Flask's key sorting and indent."""
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///test.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db = SQLAlchemy(app)
@@ -16,7 +40,7 @@ class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=db.func.now(), nullable=False)
     posts = db.relationship('Post', backref='author', lazy=True)
     
     def to_dict(self):
@@ -33,7 +57,7 @@ class Post(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     content = db.Column(db.Text, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=db.func.now(), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     
     def to_dict(self):
@@ -46,6 +70,21 @@ class Post(db.Model):
             'user_id': self.user_id
         }
 
+STREAM_BATCH_SIZE = 500
+
+def stream_json_list(query):
+    """Stream the rows of a query as a JSON array of their to_dict() forms."""
+    def generate():
+        dumps = app.json.dumps
+        separator = ''
+        yield '['
+        for row in query.yield_per(STREAM_BATCH_SIZE):
+            yield separator + dumps(row.to_dict())
+            separator = ','
+        yield ']\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
 @app.route('/')
 def index():
     """Home page."""
@@ -69,8 +108,7 @@ def users():
             return jsonify({'error': str(e)}), 500
     
     # GET request
-    all_users = User.query.all()
-    return jsonify([user.to_dict() for user in all_users])
+    return stream_json_list(User.query)
 
 @app.route('/users/<int:user_id>')
 def get_user(user_id):
@@ -102,17 +140,16 @@ def posts():
             return jsonify({'error': str(e)}), 500
     
     # GET request
-    all_posts = Post.query.all()
-    return jsonify([post.to_dict() for post in all_posts])
+    return stream_json_list(Post.query)
 
 @app.route('/users/<int:user_id>/posts')
 def user_posts(user_id):
     """Get all posts by a user."""
-    user = User.query.get_or_404(user_id)
-    posts = Post.query.filter_by(user_id=user_id).all()
+    # Load the user and their posts in one joined query
+    user = User.query.options(joinedload(User.posts)).get_or_404(user_id)
     return jsonify({
         'user': user.to_dict(),
-        'posts': [post.to_dict() for post in posts]
+        'posts': [post.to_dict() for post in user.posts]
     })
 
 @app.errorhandler(404)
@@ -1,21 +1,37 @@
 """Utility functions for Flask app."""
 
 import hashlib
+import hmac
+import re
 import secrets
 from functools import wraps
 from flask import request, jsonify
+from sqlalchemy import func
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 def generate_api_key():
     """Generate a secure API key."""
     return secrets.token_urlsafe(32)
 
+def _scrypt(password, salt):
+    """Derive the scrypt digest of a password."""
+    return hashlib.scrypt(password.encode(), salt=salt, n=16384, r=8, p=1)
+
 def hash_password(password):
-    """Hash a password using SHA256."""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hash a password using salted scrypt."""
+    salt = secrets.token_bytes(16)
+    return f"{salt.hex()}${_scrypt(password, salt).hex()}"
 
 def verify_password(password, hashed):
     """Verify a password against its hash."""
-    return hash_password(password) == hashed
+    salt, _, digest = hashed.partition('$')
+    try:
+        expected = bytes.fromhex(digest)
+        actual = _scrypt(password, bytes.fromhex(salt))
+    except ValueError:
+        return False
+    return hmac.compare_digest(actual, expected)
 
 def require_api_key(f):
     """Decorator to require API key for endpoints."""
@@ -35,8 +51,21 @@ def require_api_key(f):
 
 def paginate(query, page=1, per_page=20):
     """Paginate a SQLAlchemy query."""
-    total = query.count()
-    items = query.limit(per_page).offset((page - 1) * per_page).all()
+    # COUNT(*) OVER () returns the total with each row in the same round trip
+    rows = (
+        query.add_columns(func.count().over())
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+        .all()
+    )
+    items = [row[0] for row in rows]
+    if rows:
+        total = rows[0][-1]
+    elif page > 1:
+        # Past the last page there is no row to read the total from
+        total = query.count()
+    else:
+        total = 0
     
     return {
         'items': items,
@@ -46,6 +75,18 @@ def paginate(query, page=1, per_page=20):
         'pages': (total + per_page - 1) // per_page
     }
 
+def paginate_after(query, column, cursor=None, per_page=20):
+    """Keyset-paginate a SQLAlchemy query on a unique, ordered column."""
+    if cursor is not None:
+        query = query.filter(column > cursor)
+    items = query.order_by(column).limit(per_page).all()
+    
+    return {
+        'items': items,
+        'per_page': per_page,
+        'next_cursor': getattr(items[-1], column.key) if len(items) == per_page else None
+    }
+
 class ValidationError(Exception):
     """Custom validation error."""
     def __init__(self, message, field=None):
@@ -55,7 +96,7 @@ class ValidationError(Exception):
 
 def validate_email(email):
     """Basic email validation."""
-    if '@' not in email or '.' not in email:
+    if not _EMAIL_RE.fullmatch(email):
         raise ValidationError('Invalid email format', 'email')
     return True
 
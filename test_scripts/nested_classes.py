@@ -5,7 +5,7 @@ import abc
 from typing import Any, Optional
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Configuration:
     """Configuration dataclass."""
     host: str = "localhost"
@@ -61,20 +61,23 @@ class BaseProcessor(abc.ABC):
                 """Even more deeply nested analyzer."""
                 
                 def __init__(self):
+                    # Entries keep their input alive so its id() cannot be reused
                     self.analysis_cache = {}
                 
                 def analyze(self, input_data):
                     """Perform deep analysis."""
-                    if id(input_data) in self.analysis_cache:
-                        return self.analysis_cache[id(input_data)]
+                    cached = self.analysis_cache.get(id(input_data))
+                    if cached is not None:
+                        return cached[1]
                     
+                    text = str(input_data)
                     result = {
                         'type': type(input_data).__name__,
-                        'size': len(str(input_data)),
-                        'hash': hash(str(input_data))
+                        'size': len(text),
+                        'hash': hash(text)
                     }
                     
-                    self.analysis_cache[id(input_data)] = result
+                    self.analysis_cache[id(input_data)] = (input_data, result)
                     return result
                 
                 def clear_cache(self):
@@ -93,6 +96,8 @@ class DataProcessor(BaseProcessor):
         """Set up validation rules."""
         self.validator.add_rule(lambda x: x is not None)
         self.validator.add_rule(lambda x: len(str(x)) > 0)
+        # process_batch inlines these two rules while no others are added
+        self._default_rules = list(self.validator.rules)
     
     def process(self, item: Any) -> Optional[Any]:
         """Process an item with validation."""
@@ -104,11 +109,16 @@ class DataProcessor(BaseProcessor):
     
     def process_batch(self, items: list) -> list:
         """Process a batch of items."""
-        results = []
-        for item in items:
-            result = self.process(item)
-            if result:
-                results.append(result)
+        if self.validator.rules != self._default_rules:
+            results = []
+            for item in items:
+                result = self.process(item)
+                if result:
+                    results.append(result)
+            return results
+        
+        results = [s.upper() for s in (str(x) for x in items if x is not None) if s]
+        self.data.extend(results)
         return results
 
 def main():
@@ -9,22 +9,18 @@ from typing import List, Dict, Optional
 
 def process_data(data: List[Dict]) -> Dict:
     """Process a list of dictionaries and return summary statistics."""
-    result = {
+    # A single comprehension avoids the per-item append and result lookups
+    items = [
+        {'id': item['id'], 'value': item['value'] * 2, 'processed': True}
+        for item in data
+        if 'id' in item and 'value' in item
+    ]
+    
+    return {
         'count': len(data),
         'timestamp': datetime.now().isoformat(),
-        'items': []
+        'items': items
     }
-    
-    for item in data:
-        if 'id' in item and 'value' in item:
-            processed = {
-                'id': item['id'],
-                'value': item['value'] * 2,
-                'processed': True
-            }
-            result['items'].append(processed)
-    
-    return result
 
 def save_to_file(data: Dict, filename: str) -> bool:
     """Save data to a JSON file."""
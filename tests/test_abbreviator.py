@@ -0,0 +1,92 @@
+"""Tests for the abbreviator module."""
+
+import ast
+import glob
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "libs"))
+
+from abbreviator import DebugInfo, _NullDebugInfo, abbreviate_code, abbreviate_code_fast
+
+NESTED = '''def f(x):
+    if x:
+        for i in range(x):
+            print(i)
+            print(i * 2)
+            print(i * 3)
+    return x
+
+
+class A:
+    def m(self):
+        while True:
+            value = compute_something_long(self)
+            if value:
+                break
+'''
+
+
+def fixture_files():
+    """Get the Python fixtures shipped with the repository."""
+    patterns = ("test_scripts/*.py", "test_repos/*/*.py", "libs/*.py")
+    return sorted(path for pattern in patterns for path in glob.glob(os.path.join(ROOT, pattern)))
+
+
+class AbbreviateCodeFastTest(unittest.TestCase):
+    """abbreviate_code_fast against the LibCST abbreviate_code."""
+    
+    def test_output_parses(self):
+        for path in fixture_files():
+            with open(path, encoding="utf-8") as f:
+                code = f.read()
+            for depth in (0, 1, 2, 3):
+                with self.subTest(path=os.path.relpath(path, ROOT), depth=depth):
+                    ast.parse(abbreviate_code_fast(code, depth, 90, 2))
+    
+    def test_matches_libcst_on_plain_blocks(self):
+        for depth in (0, 1, 2, 3):
+            with self.subTest(depth=depth):
+                self.assertEqual(abbreviate_code_fast(NESTED, depth, 30, 2), abbreviate_code(NESTED, depth, 30, 2))
+    
+    def test_matches_libcst_on_fixtures(self):
+        for name in ("simple_script.py", "nested_classes.py"):
+            with open(os.path.join(ROOT, "test_scripts", name), encoding="utf-8") as f:
+                code = f.read()
+            for depth in (1, 2):
+                with self.subTest(name=name, depth=depth):
+                    self.assertEqual(abbreviate_code_fast(code, depth, 90, 2), abbreviate_code(code, depth, 90, 2))
+    
+    def test_keeps_missing_final_newline(self):
+        code = NESTED.rstrip("\n")
+        self.assertFalse(abbreviate_code_fast(code, 1, 30, 2).endswith("\n"))
+    
+    def test_shallow_code_is_unchanged(self):
+        self.assertEqual(abbreviate_code_fast(NESTED, 10, 30, 2), NESTED)
+
+
+class NullDebugInfoTest(unittest.TestCase):
+    """_NullDebugInfo must read like an empty DebugInfo."""
+    
+    def test_reads_as_empty_debug_info(self):
+        null, empty = _NullDebugInfo(), DebugInfo()
+        for name in ("nodes_considered", "nodes_abbreviated", "nodes_skipped", "max_depth_reached", "chars_saved"):
+            with self.subTest(name=name):
+                self.assertEqual(getattr(null, name), getattr(empty, name))
+        self.assertEqual(null.abbreviated_nodes, [])
+        self.assertEqual(null.skipped_nodes, [])
+        self.assertFalse(any(null.depth_counts))
+    
+    def test_records_nothing(self):
+        null = _NullDebugInfo()
+        null.consider_node(None, 3)
+        null.abbreviate_node(None, 3, 10)
+        null.skip_node(None, 3, "reason")
+        self.assertEqual(null.nodes_considered, 0)
+        self.assertEqual(null.abbreviated_nodes, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
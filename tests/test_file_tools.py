@@ -0,0 +1,31 @@
+"""Tests for the shared file system helpers."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "libs"))
+
+from file_tools import iter_files
+
+
+class IterFilesTest(unittest.TestCase):
+    """iter_files matches a recursive glob."""
+    
+    def test_finds_nested_files_and_skips_hidden(self):
+        with tempfile.TemporaryDirectory() as root:
+            for path in ("a.py", "b.txt", "pkg/c.py", "pkg/deep/d.py", ".hidden/e.py", "pkg/.f.py"):
+                path = os.path.join(root, path)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                open(path, "w").close()
+            found = sorted(os.path.relpath(path, root) for path in iter_files(root, ".py"))
+        self.assertEqual(found, ["a.py", os.path.join("pkg", "c.py"), os.path.join("pkg", "deep", "d.py")])
+    
+    def test_missing_root_yields_nothing(self):
+        self.assertEqual(list(iter_files(os.path.join(ROOT, "no-such-dir"), ".py")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
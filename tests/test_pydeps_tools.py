@@ -0,0 +1,58 @@
+"""Tests for the pydeps result cache."""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "libs"))
+
+import pydeps_tools
+
+
+def completed(stdout):
+    """Build the result of a successful pydeps process."""
+    return subprocess.CompletedProcess([], 0, stdout=stdout, stderr="")
+
+
+class RunPydepsCacheTest(unittest.TestCase):
+    """run_pydeps caches successful runs only."""
+    
+    def setUp(self):
+        pydeps_tools._pydeps_results.clear()
+        self.addCleanup(pydeps_tools._pydeps_results.clear)
+        handle, self.script = tempfile.mkstemp(suffix=".py")
+        os.close(handle)
+        self.addCleanup(os.remove, self.script)
+    
+    def test_success_is_cached_and_copied(self):
+        with mock.patch("subprocess.run", return_value=completed('{"bot": {"bacon": 0}}')) as run:
+            first = pydeps_tools.run_pydeps(self.script)
+            first["bot"]["bacon"] = 5
+            second = pydeps_tools.run_pydeps(self.script)
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(second, {"bot": {"bacon": 0}})
+    
+    def test_process_failure_is_retried(self):
+        error = subprocess.CalledProcessError(1, "pydeps", stderr="boom")
+        with mock.patch("subprocess.run", side_effect=[error, completed('{"bot": {}}')]) as run, \
+                mock.patch("builtins.print"):
+            failed = pydeps_tools.run_pydeps(self.script)
+            retried = pydeps_tools.run_pydeps(self.script)
+        self.assertIn("error", next(iter(failed.values())))
+        self.assertEqual(retried, {"bot": {}})
+        self.assertEqual(run.call_count, 2)
+    
+    def test_unparsable_output_is_retried(self):
+        with mock.patch("subprocess.run", side_effect=[completed("not json"), completed('{"bot": {}}')]) as run, \
+                mock.patch("builtins.print"):
+            self.assertIsNone(pydeps_tools.run_pydeps(self.script))
+            self.assertEqual(pydeps_tools.run_pydeps(self.script), {"bot": {}})
+        self.assertEqual(run.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()